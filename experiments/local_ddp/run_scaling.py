@@ -0,0 +1,55 @@
+import argparse
+import time
+
+import pandas as pd
+
+from neuralforecast import LocalDistributedConfig, NeuralForecast
+from neuralforecast.models import NHITS
+from neuralforecast.utils import generate_series
+
+
+def train_time(df, num_processes, max_steps, batch_size):
+    model = NHITS(
+        h=24,
+        input_size=48,
+        max_steps=max_steps,
+        batch_size=batch_size,
+        val_check_steps=max_steps,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    nf = NeuralForecast(models=[model], freq="D")
+    if num_processes == 1:
+        distributed_config = None
+    else:
+        distributed_config = LocalDistributedConfig(num_processes=num_processes)
+    start = time.perf_counter()
+    nf.fit(df, distributed_config=distributed_config)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_series", type=int, default=10_000)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--max_steps", type=int, default=200)
+    parser.add_argument("--batch_size", type=int, default=32)
+    args = parser.parse_args()
+
+    df = generate_series(args.n_series, min_length=200, max_length=1_000)
+    results = []
+    for num_processes in args.processes:
+        elapsed = train_time(df, num_processes, args.max_steps, args.batch_size)
+        # every process takes max_steps steps over batch_size series of its own shard
+        throughput = num_processes * args.max_steps * args.batch_size / elapsed
+        results.append([num_processes, elapsed, throughput])
+
+    results_df = pd.DataFrame(
+        results, columns=["processes", "time", "series_per_second"]
+    )
+    single = results_df.loc[results_df["processes"] == 1, "series_per_second"]
+    if not single.empty:
+        speedup = results_df["series_per_second"] / single.iloc[0]
+        results_df["speedup"] = speedup
+        results_df["efficiency"] = speedup / results_df["processes"]
+    print(results_df.to_string(index=False, float_format="{:.2f}".format))
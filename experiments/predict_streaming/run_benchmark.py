@@ -0,0 +1,114 @@
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from neuralforecast import NeuralForecast
+from neuralforecast.models import NHITS
+from neuralforecast.utils import generate_series
+
+H = 30
+
+
+def memory_mb(field):
+    # current (VmRSS) or peak (VmHWM) resident memory of the process
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field):
+                return int(line.split()[1]) / 1024
+
+
+def reset_peak_memory():
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+
+
+def dir_size_mb(path):
+    size = 0
+    for root, _, files in os.walk(path):
+        size += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return size / 1024**2
+
+
+def run_mode(mode, model_path, output_path, shard_size, partition_by, queue):
+    # every mode runs in a fresh process, so its peak memory isn't affected by the others
+    nf = NeuralForecast.load(model_path)
+    # the peak of loading the model isn't counted
+    reset_peak_memory()
+    before = memory_mb("VmRSS")
+    start = time.perf_counter()
+    if mode == "predict":
+        nf.predict()
+    elif mode == "predict_arrays":
+        nf.predict(output="arrays")
+    elif mode == "predict_iter":
+        for _ in nf.predict_iter(shard_size=shard_size):
+            pass
+    else:
+        nf.predict_to_parquet(
+            output_path, shard_size=shard_size, partition_by=partition_by
+        )
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, memory_mb("VmHWM") - before))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_series", type=int, default=200_000)
+    parser.add_argument("--shard_size", type=int, default=10_000)
+    parser.add_argument("--partition_by", nargs="*", default=None)
+    args = parser.parse_args()
+
+    df = generate_series(args.n_series, min_length=100, max_length=200)
+    model = NHITS(
+        h=H,
+        input_size=2 * H,
+        max_steps=10,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    nf = NeuralForecast(models=[model], freq="D")
+    nf.fit(df)
+    n_rows = args.n_series * H
+
+    ctx = mp.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model_path = f"{tmpdir}/model"
+        nf.save(model_path, save_dataset=True)
+        for mode in ["predict", "predict_arrays", "predict_iter", "predict_to_parquet"]:
+            output_path = f"{tmpdir}/{mode}"
+            queue = ctx.Queue()
+            process = ctx.Process(
+                target=run_mode,
+                args=(
+                    mode,
+                    model_path,
+                    output_path,
+                    args.shard_size,
+                    args.partition_by,
+                    queue,
+                ),
+            )
+            process.start()
+            elapsed, peak_mb = queue.get()
+            process.join()
+            written_mb = dir_size_mb(output_path) if os.path.exists(output_path) else None
+            results.append(
+                [
+                    mode,
+                    elapsed,
+                    n_rows / elapsed,
+                    written_mb / elapsed if written_mb is not None else None,
+                    peak_mb,
+                ]
+            )
+
+    results_df = pd.DataFrame(
+        results,
+        columns=["mode", "time", "rows_per_second", "write_mb_per_second", "peak_mb"],
+    )
+    print(results_df.to_string(index=False, float_format="{:,.2f}".format))
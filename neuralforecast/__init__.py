@@ -1,4 +1,4 @@
 __version__ = "3.0.0"
 __all__ = ['NeuralForecast']
 from .core import NeuralForecast
-from .common._base_model import DistributedConfig  # noqa: F401
+from .common._base_model import DistributedConfig, LocalDistributedConfig  # noqa: F401
@@ -162,13 +162,36 @@ d = { 'settings': { 'branch': 'main',
                                      'neuralforecast.auto.AutoiTransformer.get_default_config': ( 'models.html#autoitransformer.get_default_config',
                                                                                                   'neuralforecast/auto.py')},
             'neuralforecast.compat': {},
-            'neuralforecast.core': { 'neuralforecast.core.NeuralForecast': ('core.html#neuralforecast', 'neuralforecast/core.py'),
+            'neuralforecast.core': { 'neuralforecast.core.ForecastArrays': ('core.html#forecastarrays', 'neuralforecast/core.py'),
+                                     'neuralforecast.core.ForecastArrays.to_frame': ( 'core.html#forecastarrays.to_frame',
+                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast': ('core.html#neuralforecast', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.__init__': ( 'core.html#neuralforecast.__init__',
                                                                                       'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._backtest_views': ( 'core.html#neuralforecast._backtest_views',
+                                                                                             'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._check_futr_df': ( 'core.html#neuralforecast._check_futr_df',
+                                                                                            'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._check_nan': ( 'core.html#neuralforecast._check_nan',
                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._check_predict_args': ( 'core.html#neuralforecast._check_predict_args',
+                                                                                                 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._conformity_scores': ( 'core.html#neuralforecast._conformity_scores',
                                                                                                 'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._dataset_from_input': ( 'core.html#neuralforecast._dataset_from_input',
+                                                                                                 'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._for_shard': ( 'core.html#neuralforecast._for_shard',
+                                                                                        'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._forecast_dataset': ( 'core.html#neuralforecast._forecast_dataset',
+                                                                                               'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._forecast_inputs': ( 'core.html#neuralforecast._forecast_inputs',
+                                                                                              'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._forecast_shards': ( 'core.html#neuralforecast._forecast_shards',
+                                                                                              'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._forecast_values': ( 'core.html#neuralforecast._forecast_values',
+                                                                                              'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._forecasts_output': ( 'core.html#neuralforecast._forecasts_output',
+                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._generate_forecasts': ( 'core.html#neuralforecast._generate_forecasts',
                                                                                                  'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._get_column_name': ( 'core.html#neuralforecast._get_column_name',
@@ -179,24 +202,56 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._get_needed_futr_exog': ( 'core.html#neuralforecast._get_needed_futr_exog',
                                                                                                    'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._is_distributed_predict': ( 'core.html#neuralforecast._is_distributed_predict',
+                                                                                                     'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._maybe_compact_times': ( 'core.html#neuralforecast._maybe_compact_times',
+                                                                                                  'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._no_refit_cross_validation': ( 'core.html#neuralforecast._no_refit_cross_validation',
                                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._parallel_refit_windows': ( 'core.html#neuralforecast._parallel_refit_windows',
+                                                                                                     'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._predict_dataset': ( 'core.html#neuralforecast._predict_dataset',
+                                                                                              'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._predict_distributed': ( 'core.html#neuralforecast._predict_distributed',
                                                                                                   'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._predict_lookback': ( 'core.html#neuralforecast._predict_lookback',
+                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit': ( 'core.html#neuralforecast._prepare_fit',
                                                                                           'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit_distributed': ( 'core.html#neuralforecast._prepare_fit_distributed',
                                                                                                       'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit_for_local_files': ( 'core.html#neuralforecast._prepare_fit_for_local_files',
                                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._preprocessing_cache_key': ( 'core.html#neuralforecast._preprocessing_cache_key',
+                                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._print_preprocessing_times': ( 'core.html#neuralforecast._print_preprocessing_times',
+                                                                                                        'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._print_shards_imbalance': ( 'core.html#neuralforecast._print_shards_imbalance',
+                                                                                                     'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._refit_windows': ( 'core.html#neuralforecast._refit_windows',
+                                                                                            'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._reset_models': ( 'core.html#neuralforecast._reset_models',
                                                                                            'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._scalers_fit': ( 'core.html#neuralforecast._scalers_fit',
+                                                                                          'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._scalers_fit_transform': ( 'core.html#neuralforecast._scalers_fit_transform',
                                                                                                     'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._scalers_target_inverse_transform': ( 'core.html#neuralforecast._scalers_target_inverse_transform',
                                                                                                                'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._scalers_transform': ( 'core.html#neuralforecast._scalers_transform',
                                                                                                 'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._scan_lazy': ( 'core.html#neuralforecast._scan_lazy',
+                                                                                        'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._set_window_dataset': ( 'core.html#neuralforecast._set_window_dataset',
+                                                                                                 'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._shards_inputs': ( 'core.html#neuralforecast._shards_inputs',
+                                                                                            'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._streaming_cross_validation': ( 'core.html#neuralforecast._streaming_cross_validation',
+                                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._take_series': ( 'core.html#neuralforecast._take_series',
+                                                                                          'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.compact': ( 'core.html#neuralforecast.compact',
+                                                                                     'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.cross_validation': ( 'core.html#neuralforecast.cross_validation',
                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.fit': ('core.html#neuralforecast.fit', 'neuralforecast/core.py'),
@@ -209,8 +264,60 @@ d = { 'settings': { 'branch': 'main',
                                                                                      'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.predict_insample': ( 'core.html#neuralforecast.predict_insample',
                                                                                               'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.predict_iter': ( 'core.html#neuralforecast.predict_iter',
+                                                                                          'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.predict_scenarios': ( 'core.html#neuralforecast.predict_scenarios',
+                                                                                               'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.predict_to_parquet': ( 'core.html#neuralforecast.predict_to_parquet',
+                                                                                                'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.save': ('core.html#neuralforecast.save', 'neuralforecast/core.py'),
-                                     'neuralforecast.core._insample_times': ('core.html#_insample_times', 'neuralforecast/core.py')},
+                                     'neuralforecast.core._PreprocessingCache': ('core.html#_preprocessingcache', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._PreprocessingCache.__init__': ( 'core.html#_preprocessingcache.__init__',
+                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core._PreprocessingCache._evict': ( 'core.html#_preprocessingcache._evict',
+                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core._PreprocessingCache._file': ( 'core.html#_preprocessingcache._file',
+                                                                                        'neuralforecast/core.py'),
+                                     'neuralforecast.core._PreprocessingCache.get': ( 'core.html#_preprocessingcache.get',
+                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core._PreprocessingCache.put': ( 'core.html#_preprocessingcache.put',
+                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core._approx_nbytes': ('core.html#_approx_nbytes', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._categorical_cols': ('core.html#_categorical_cols', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._concat_forecast_arrays': ( 'core.html#_concat_forecast_arrays',
+                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core._distributed_predictor': ( 'core.html#_distributed_predictor',
+                                                                                     'neuralforecast/core.py'),
+                                     'neuralforecast.core._files_list': ('core.html#_files_list', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._fixed_step': ('core.html#_fixed_step', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._forecasts_frame': ('core.html#_forecasts_frame', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._frame_fingerprint': ('core.html#_frame_fingerprint', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._future_slots': ('core.html#_future_slots', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._imap_bounded': ('core.html#_imap_bounded', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._init_predict_worker': ( 'core.html#_init_predict_worker',
+                                                                                   'neuralforecast/core.py'),
+                                     'neuralforecast.core._insample_times': ('core.html#_insample_times', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._is_array_input': ('core.html#_is_array_input', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._is_lazy_input': ('core.html#_is_lazy_input', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._is_packed_files': ('core.html#_is_packed_files', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._map_threaded': ('core.html#_map_threaded', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._output_quantile': ('core.html#_output_quantile', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._predict_shard_worker': ( 'core.html#_predict_shard_worker',
+                                                                                    'neuralforecast/core.py'),
+                                     'neuralforecast.core._refit_windows_worker': ( 'core.html#_refit_windows_worker',
+                                                                                    'neuralforecast/core.py'),
+                                     'neuralforecast.core._scan_arrow_dataset': ('core.html#_scan_arrow_dataset', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._scan_lazy_frame': ('core.html#_scan_lazy_frame', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._series_tails': ('core.html#_series_tails', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._shard_bounds': ('core.html#_shard_bounds', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._split_futr_df': ('core.html#_split_futr_df', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._stack_scalers': ('core.html#_stack_scalers', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._tee_columns': ('core.html#_tee_columns', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._timed': ('core.html#_timed', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._to_pandas': ('core.html#_to_pandas', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._window_sizes': ('core.html#_window_sizes', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._windows_metrics': ('core.html#_windows_metrics', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._write_forecasts': ('core.html#_write_forecasts', 'neuralforecast/core.py')},
             'neuralforecast.losses.numpy': { 'neuralforecast.losses.numpy._divide_no_nan': ( 'losses.numpy.html#_divide_no_nan',
                                                                                              'neuralforecast/losses/numpy.py'),
                                              'neuralforecast.losses.numpy._metric_protections': ( 'losses.numpy.html#_metric_protections',
@@ -1383,6 +1490,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                        'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.BaseTimeSeriesDataset.__len__': ( 'tsdataset.html#basetimeseriesdataset.__len__',
                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.BaseTimeSeriesDataset._arrow_temporal': ( 'tsdataset.html#basetimeseriesdataset._arrow_temporal',
+                                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.BaseTimeSeriesDataset._arrow_temporal_cols': ( 'tsdataset.html#basetimeseriesdataset._arrow_temporal_cols',
+                                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.BaseTimeSeriesDataset._as_torch': ( 'tsdataset.html#basetimeseriesdataset._as_torch',
+                                                                                                        'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.BaseTimeSeriesDataset._as_torch_copy': ( 'tsdataset.html#basetimeseriesdataset._as_torch_copy',
                                                                                                              'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.BaseTimeSeriesDataset._ensure_available_mask': ( 'tsdataset.html#basetimeseriesdataset._ensure_available_mask',
@@ -1393,10 +1506,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                                     'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.__getitem__': ( 'tsdataset.html#localfilestimeseriesdataset.__getitem__',
                                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.__getstate__': ( 'tsdataset.html#localfilestimeseriesdataset.__getstate__',
+                                                                                                                 'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.__init__': ( 'tsdataset.html#localfilestimeseriesdataset.__init__',
                                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset._packed_file': ( 'tsdataset.html#localfilestimeseriesdataset._packed_file',
+                                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset._read_serie': ( 'tsdataset.html#localfilestimeseriesdataset._read_serie',
+                                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset._read_tail': ( 'tsdataset.html#localfilestimeseriesdataset._read_tail',
+                                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset._scale': ( 'tsdataset.html#localfilestimeseriesdataset._scale',
+                                                                                                           'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.from_data_directories': ( 'tsdataset.html#localfilestimeseriesdataset.from_data_directories',
                                                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.from_packed': ( 'tsdataset.html#localfilestimeseriesdataset.from_packed',
+                                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.pack': ( 'tsdataset.html#localfilestimeseriesdataset.pack',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.read_tails': ( 'tsdataset.html#localfilestimeseriesdataset.read_tails',
+                                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesArrays': ( 'tsdataset.html#timeseriesarrays',
+                                                                                         'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule': ( 'tsdataset.html#timeseriesdatamodule',
                                                                                              'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.__init__': ( 'tsdataset.html#timeseriesdatamodule.__init__',
@@ -1419,12 +1550,30 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.align': ( 'tsdataset.html#timeseriesdataset.align',
                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.align_slots': ( 'tsdataset.html#timeseriesdataset.align_slots',
+                                                                                                      'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.append': ( 'tsdataset.html#timeseriesdataset.append',
                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.concat': ( 'tsdataset.html#timeseriesdataset.concat',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.empty_future': ( 'tsdataset.html#timeseriesdataset.empty_future',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.from_arrays': ( 'tsdataset.html#timeseriesdataset.from_arrays',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.from_arrow': ( 'tsdataset.html#timeseriesdataset.from_arrow',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.from_batches': ( 'tsdataset.html#timeseriesdataset.from_batches',
+                                                                                                       'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.from_df': ( 'tsdataset.html#timeseriesdataset.from_df',
                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.take': ( 'tsdataset.html#timeseriesdataset.take',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.take_range': ( 'tsdataset.html#timeseriesdataset.take_range',
+                                                                                                     'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.trim_dataset': ( 'tsdataset.html#timeseriesdataset.trim_dataset',
                                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.truncate': ( 'tsdataset.html#timeseriesdataset.truncate',
+                                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.update_dataset': ( 'tsdataset.html#timeseriesdataset.update_dataset',
                                                                                                          'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader': ( 'tsdataset.html#timeseriesloader',
@@ -1433,6 +1582,22 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader._collate_fn': ( 'tsdataset.html#timeseriesloader._collate_fn',
                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._CompactTimes': ( 'tsdataset.html#_compacttimes',
+                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._CompactTimes.__array__': ( 'tsdataset.html#_compacttimes.__array__',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._CompactTimes.__getitem__': ( 'tsdataset.html#_compacttimes.__getitem__',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._CompactTimes.__init__': ( 'tsdataset.html#_compacttimes.__init__',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._CompactTimes.__len__': ( 'tsdataset.html#_compacttimes.__len__',
+                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._CompactTimes.__repr__': ( 'tsdataset.html#_compacttimes.__repr__',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._CompactTimes.from_times': ( 'tsdataset.html#_compacttimes.from_times',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._CompactTimes.take_series_rows': ( 'tsdataset.html#_compacttimes.take_series_rows',
+                                                                                                       'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset._DistributedTimeSeriesDataModule': ( 'tsdataset.html#_distributedtimeseriesdatamodule',
                                                                                                          'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset._DistributedTimeSeriesDataModule.__init__': ( 'tsdataset.html#_distributedtimeseriesdatamodule.__init__',
@@ -1442,7 +1607,37 @@ d = { 'settings': { 'branch': 'main',
                                           'neuralforecast.tsdataset._FilesDataset': ( 'tsdataset.html#_filesdataset',
                                                                                       'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset._FilesDataset.__init__': ( 'tsdataset.html#_filesdataset.__init__',
-                                                                                               'neuralforecast/tsdataset.py')},
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._FilesDataset.read': ( 'tsdataset.html#_filesdataset.read',
+                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ShardedTimeSeriesDataModule': ( 'tsdataset.html#_shardedtimeseriesdatamodule',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ShardedTimeSeriesDataModule.__init__': ( 'tsdataset.html#_shardedtimeseriesdatamodule.__init__',
+                                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ShardedTimeSeriesDataModule.setup': ( 'tsdataset.html#_shardedtimeseriesdatamodule.setup',
+                                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._TimeSeriesDatasetView': ( 'tsdataset.html#_timeseriesdatasetview',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._TimeSeriesDatasetView.__getitem__': ( 'tsdataset.html#_timeseriesdatasetview.__getitem__',
+                                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._TimeSeriesDatasetView.__init__': ( 'tsdataset.html#_timeseriesdatasetview.__init__',
+                                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._TimeSeriesDatasetView.__repr__': ( 'tsdataset.html#_timeseriesdatasetview.__repr__',
+                                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._TimeSeriesDatasetView.append': ( 'tsdataset.html#_timeseriesdatasetview.append',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._TimeSeriesDatasetView.materialize': ( 'tsdataset.html#_timeseriesdatasetview.materialize',
+                                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._TimeSeriesDatasetView.take_idxs': ( 'tsdataset.html#_timeseriesdatasetview.take_idxs',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._balance_shards': ( 'tsdataset.html#_balance_shards',
+                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._series_sizes': ( 'tsdataset.html#_series_sizes',
+                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._shards_imbalance': ( 'tsdataset.html#_shards_imbalance',
+                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._take_scalers': ( 'tsdataset.html#_take_scalers',
+                                                                                      'neuralforecast/tsdataset.py')},
             'neuralforecast.utils': { 'neuralforecast.utils.DayOfMonth': ('utils.html#dayofmonth', 'neuralforecast/utils.py'),
                                       'neuralforecast.utils.DayOfMonth.__call__': ( 'utils.html#dayofmonth.__call__',
                                                                                     'neuralforecast/utils.py'),
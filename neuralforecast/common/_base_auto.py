@@ -6,6 +6,7 @@ __all__ = ['BaseAuto']
 # %% ../../nbs/common.base_auto.ipynb 5
 import warnings
 from copy import deepcopy
+from functools import partial
 from os import cpu_count
 
 import torch
@@ -36,6 +37,10 @@ class MockTrial:
             return "quantized_loguniform"
         return "float"
 
+
+def _merge_config(config, config_base, trial):
+    return {**config(trial), **config_base}
+
 # %% ../../nbs/common.base_auto.ipynb 7
 class BaseAuto(pl.LightningModule):
     """
@@ -156,11 +161,8 @@ class BaseAuto(pl.LightningModule):
         if isinstance(config, dict):
             self.config = config_base
         else:
-
-            def config_f(trial):
-                return {**config(trial), **config_base}
-
-            self.config = config_f
+            # a partial instead of a closure, so the model can be pickled
+            self.config = partial(_merge_config, config, config_base)
 
         self.h = h
         self.cls_model = cls_model
@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/common.base_model.ipynb.
 
 # %% auto 0
-__all__ = ['DistributedConfig', 'BaseModel']
+__all__ = ['DistributedConfig', 'LocalDistributedConfig', 'BaseModel']
 
 # %% ../../nbs/common.base_model.ipynb 2
 import inspect
@@ -10,7 +10,7 @@ import warnings
 from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Union
 
 import fsspec
 import numpy as np
@@ -26,6 +26,7 @@ from neuralforecast.tsdataset import (
     TimeSeriesDataModule,
     BaseTimeSeriesDataset,
     _DistributedTimeSeriesDataModule,
+    _ShardedTimeSeriesDataModule,
 )
 from ._scalers import TemporalNorm
 from ..utils import get_indexer_raise_missing
@@ -37,6 +38,18 @@ class DistributedConfig:
     num_nodes: int
     devices: int
 
+
+@dataclass
+class LocalDistributedConfig:
+    """Data parallel training on several processes of this machine, without spark.
+    Each process trains on a shard of the series and their gradients are averaged.
+    `shards` has the process of each serie, balanced by their sizes if None."""
+
+    num_processes: int
+    backend: str = "gloo"
+    start_method: str = "fork"
+    shards: Optional[np.ndarray] = None
+
 # %% ../../nbs/common.base_model.ipynb 4
 @contextmanager
 def _disable_torch_init():
@@ -372,6 +385,11 @@ class BaseModel(pl.LightningModule):
         # Model state
         self.decompose_forecast = False
 
+        # Warm start, number of steps to resume training with from the optimizer state
+        # of the previous fit. See `NeuralForecast.cross_validation(refit_strategy='warm_start')`
+        self.warm_start_steps = None
+        self._optimizer_state = None
+
         # DataModule arguments
         self.dataloader_kwargs = dataloader_kwargs
         self.drop_last_loader = drop_last_loader
@@ -497,6 +515,51 @@ class BaseModel(pl.LightningModule):
         )
         return model
 
+    def _fit_local_distributed(self, distributed_config, datamodule):
+        from pytorch_lightning.strategies import DDPStrategy
+
+        if self.MULTIVARIATE:
+            raise ValueError(
+                "Multivariate models can't be trained with their series split between processes."
+            )
+        n_series = len(datamodule.full_dataset)
+        if distributed_config.num_processes > n_series:
+            raise ValueError(
+                f"num_processes ({distributed_config.num_processes}) can't be greater "
+                f"than the number of series ({n_series:,})."
+            )
+        shards = distributed_config.shards
+        if shards is not None:
+            shards = np.asarray(shards)
+            n_procs = distributed_config.num_processes
+            if shards.shape != (n_series,) or not np.isin(shards, range(n_procs)).all():
+                raise ValueError(
+                    f"shards must have the process of each of the {n_series:,} series, "
+                    f"from 0 to {n_procs - 1}."
+                )
+            if np.bincount(shards, minlength=n_procs).min() == 0:
+                raise ValueError("Every process must get at least one serie.")
+        datamodule.shards = shards
+        trainer_kwargs = {
+            k: v
+            for k, v in self.trainer_kwargs.items()
+            if k not in ("devices", "num_nodes", "strategy")
+        }
+        trainer = pl.Trainer(
+            strategy=DDPStrategy(
+                process_group_backend=distributed_config.backend,
+                start_method=distributed_config.start_method,
+            ),
+            use_distributed_sampler=False,  # each process reads its own shard
+            devices=distributed_config.num_processes,
+            **trainer_kwargs,
+        )
+        # the weights of the first process are loaded back into this model
+        trainer.fit(self, datamodule=datamodule)
+        self.metrics = trainer.callback_metrics
+        self.__dict__.pop("_trainer", None)
+        return self
+
     def _fit(
         self,
         dataset,
@@ -514,7 +577,10 @@ class BaseModel(pl.LightningModule):
         self.val_size = val_size
         self.test_size = test_size
         is_local = isinstance(dataset, BaseTimeSeriesDataset)
-        if is_local:
+        local_ddp = is_local and isinstance(distributed_config, LocalDistributedConfig)
+        if local_ddp:
+            datamodule_constructor = _ShardedTimeSeriesDataModule
+        elif is_local:
             datamodule_constructor = TimeSeriesDataModule
         else:
             datamodule_constructor = _DistributedTimeSeriesDataModule
@@ -540,11 +606,30 @@ class BaseModel(pl.LightningModule):
         self.trainer_kwargs["val_check_interval"] = int(val_check_interval)
         self.trainer_kwargs["check_val_every_n_epoch"] = None
 
-        if is_local:
+        if local_ddp:
+            model = self._fit_local_distributed(distributed_config, datamodule)
+        elif is_local:
             model = self
-            trainer = pl.Trainer(**model.trainer_kwargs)
+            trainer_kwargs = model.trainer_kwargs
+            if model._is_warm_start():
+                # resume from the previous weights and optimizer state with a reduced budget
+                trainer_kwargs = {
+                    **trainer_kwargs,
+                    "max_steps": model.warm_start_steps,
+                    "val_check_interval": int(
+                        min(model.val_check_steps, model.warm_start_steps)
+                    ),
+                }
+            trainer = pl.Trainer(**trainer_kwargs)
             trainer.fit(model, datamodule=datamodule)
             model.metrics = trainer.callback_metrics
+            if model.warm_start_steps is not None:
+                model._optimizer_state = {
+                    "optimizer": trainer.optimizers[0].state_dict(),
+                    "lr_scheduler": trainer.lr_scheduler_configs[
+                        0
+                    ].scheduler.state_dict(),
+                }
             model.__dict__.pop("_trainer", None)
         else:
             model = self._fit_distributed(
@@ -555,6 +640,9 @@ class BaseModel(pl.LightningModule):
             )
         return model
 
+    def _is_warm_start(self):
+        return self.warm_start_steps is not None and self._optimizer_state is not None
+
     def on_fit_start(self):
         torch.manual_seed(self.random_seed)
         np.random.seed(self.random_seed)
@@ -599,6 +687,12 @@ class BaseModel(pl.LightningModule):
             lr_scheduler["scheduler"] = torch.optim.lr_scheduler.StepLR(
                 optimizer=optimizer, step_size=self.lr_decay_steps, gamma=0.5
             )
+
+        if self._is_warm_start():
+            optimizer.load_state_dict(self._optimizer_state["optimizer"])
+            lr_scheduler["scheduler"].load_state_dict(
+                self._optimizer_state["lr_scheduler"]
+            )
         return {"optimizer": optimizer, "lr_scheduler": lr_scheduler}
 
     def get_test_size(self):
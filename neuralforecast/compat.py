@@ -9,3 +9,18 @@ try:
 except ImportError:
 
     class SparkDataFrame: ...
+
+try:
+    from pyarrow import Table as ArrowTable
+    from pyarrow.dataset import Dataset as ArrowDataset
+except ImportError:
+
+    class ArrowTable: ...
+
+    class ArrowDataset: ...
+
+try:
+    from polars import LazyFrame as PolarsLazyFrame
+except ImportError:
+
+    class PolarsLazyFrame: ...
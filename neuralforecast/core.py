@@ -1,14 +1,33 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/core.ipynb.
 
 # %% auto 0
-__all__ = ['NeuralForecast']
+__all__ = ['ForecastArrays', 'NeuralForecast']
 
 # %% ../nbs/core.ipynb 4
+import hashlib
+import os
 import pickle
+import re
+import time
 import warnings
-from copy import deepcopy
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from copy import copy, deepcopy
+from dataclasses import replace
 from itertools import chain
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import fsspec
 import numpy as np
@@ -26,11 +45,19 @@ from coreforecast.scalers import (
 from utilsforecast.compat import DataFrame, DFType, Series, pl_DataFrame, pl_Series
 from utilsforecast.validation import validate_freq
 
-from .common._base_model import DistributedConfig
-from .compat import SparkDataFrame
+from .common._base_model import DistributedConfig, LocalDistributedConfig
+from .compat import ArrowDataset, ArrowTable, PolarsLazyFrame, SparkDataFrame
+from .losses.numpy import quantile_loss
 from .losses.pytorch import IQLoss
 from neuralforecast.tsdataset import (
+    _CompactTimes,
     _FilesDataset,
+    _balance_shards,
+    _series_sizes,
+    _shards_imbalance,
+    _take_scalers,
+    _TimeSeriesDatasetView,
+    TimeSeriesArrays,
     TimeSeriesDataset,
     LocalFilesTimeSeriesDataset,
 )
@@ -135,6 +162,544 @@ def _insample_times(
     out = ufp.assign_columns(out, "cutoff", actual_cutoffs)
     return out
 
+
+def _window_sizes(
+    times: np.ndarray,
+    indptr: np.ndarray,
+    train_ends: np.ndarray,
+    valid_ends: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # times are sorted within each serie, so the train and validation samples
+    # are contiguous and we only need to count them
+    sizes = np.diff(indptr)
+    row_train_ends = np.repeat(train_ends, sizes)
+    row_valid_ends = np.repeat(valid_ends, sizes)
+    train_mask = times <= row_train_ends
+    valid_mask = (times > row_train_ends) & (times <= row_valid_ends)
+    train_sizes = np.add.reduceat(train_mask, indptr[:-1]).astype(indptr.dtype)
+    valid_sizes = np.add.reduceat(valid_mask, indptr[:-1]).astype(indptr.dtype)
+    return train_sizes, valid_sizes
+
+
+def _series_tails(df: DFType, n: int, id_col: str, time_col: str) -> DFType:
+    # keeps the last n samples of each serie, sorting only the ids and times
+    # polars counts are unsigned, which would turn the differences into floats
+    sizes = ufp.counts_by_id(df, id_col)["counts"].to_numpy().astype(np.int64)
+    if (sizes <= n).all():
+        return df
+    tail_sizes = np.minimum(sizes, n)
+    tails_indptr = np.append(0, tail_sizes.cumsum())
+    idxs = np.repeat(
+        sizes.cumsum() - tail_sizes - tails_indptr[:-1], tail_sizes
+    ) + np.arange(tails_indptr[-1])
+    sort_idxs = ufp.maybe_compute_sort_indices(df, id_col, time_col)
+    if sort_idxs is not None:
+        idxs = sort_idxs[idxs]
+    return ufp.take_rows(df, idxs)
+
+
+def _output_quantile(name: str) -> Optional[float]:
+    # quantile predicted by a model output, taken from the suffix of its name
+    if name.endswith("-median"):
+        return 0.5
+    match = re.search(r"-(lo|hi)-(\d+(?:\.\d+)?)$", name)
+    if match is not None:
+        side, level = match.groups()
+        delta = float(level) / 200
+        return 0.5 - delta if side == "lo" else 0.5 + delta
+    match = re.search(r"_ql(\d+(?:\.\d+)?)$", name)
+    if match is not None:
+        return float(match.group(1))
+    return None
+
+
+def _windows_metrics(
+    y: np.ndarray,
+    y_hat: np.ndarray,
+    cols: List[str],
+    metrics: List[Callable],
+) -> Dict[str, np.ndarray]:
+    # y has shape [n_windows, h] and y_hat [n_windows, h, n_outputs]
+    # returns the value of each metric for each window and output
+    out = {}
+    for metric in metrics:
+        values = np.full((y.shape[0], len(cols)), np.nan)
+        for i, col in enumerate(cols):
+            if metric is quantile_loss:
+                # only evaluated on the quantile outputs
+                q = _output_quantile(col)
+                if q is None:
+                    continue
+                values[:, i] = quantile_loss(y, y_hat[..., i], q=q, axis=1)
+            else:
+                values[:, i] = metric(y, y_hat[..., i], axis=1)
+        out[metric.__name__] = values
+    return out
+
+
+# the attributes set by fitting and predicting the refit windows
+_REFIT_ATTRS = (
+    "models",
+    "dataset",
+    "uids",
+    "last_dates",
+    "ds",
+    "scalers_",
+    "id_col",
+    "time_col",
+    "target_col",
+    "prediction_intervals",
+    "_cs_df",
+    "preprocessing_times_",
+    "_add_level",
+    "_fitted",
+)
+
+
+def _refit_windows_worker(
+    nf,
+    splits,
+    num_threads: Optional[int],
+    return_state: bool,
+    kwargs: Dict[str, Any],
+):
+    # runs a group of cross validation windows starting from a copy of the models
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+    nf = copy(nf)
+    nf.models = [deepcopy(model) for model in nf.models]
+    results = nf._refit_windows(splits, **kwargs)
+    return results, nf if return_state else None
+
+
+def _frame_fingerprint(df: Optional[DataFrame], n_samples: int = 1_000) -> str:
+    # cheap fingerprint of a frame: its schema and the hashes of evenly spaced rows
+    if df is None:
+        return "None"
+    hasher = hashlib.sha1()
+    schema = [(c, str(df[c].dtype)) for c in df.columns]
+    hasher.update(repr((type(df).__name__, df.shape, schema)).encode())
+    if df.shape[0] > 0:
+        idxs = np.unique(np.linspace(0, df.shape[0] - 1, n_samples).astype(np.int64))
+        sample = ufp.take_rows(df, idxs)
+        if isinstance(sample, pd.DataFrame):
+            hashes = pd.util.hash_pandas_object(sample, index=False).to_numpy()
+        else:
+            hashes = sample.hash_rows().to_numpy()
+        hasher.update(hashes.tobytes())
+    return hasher.hexdigest()
+
+
+def _approx_nbytes(obj: Any) -> int:
+    if obj is None:
+        return 0
+    if isinstance(obj, (tuple, list)):
+        return sum(_approx_nbytes(x) for x in obj)
+    if isinstance(obj, dict):
+        return sum(_approx_nbytes(x) for x in obj.values())
+    if isinstance(obj, torch.Tensor):
+        return obj.element_size() * obj.nelement()
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, TimeSeriesDataset):
+        return _approx_nbytes([obj.temporal, obj.static, obj.indptr])
+    if isinstance(obj, _CompactTimes):
+        return _approx_nbytes([obj.grid, obj.starts, obj.indptr])
+    if isinstance(obj, (pd.Index, pd.Series)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, pl_Series):
+        return int(obj.estimated_size())
+    return len(pickle.dumps(obj))
+
+
+class _PreprocessingCache:
+    """Least recently used cache of prepared datasets.
+
+    Entries are kept in memory, or pickled to `path` if it's provided, and the
+    least recently used ones are evicted once all of them take more than `max_bytes`.
+    The entries kept in memory are copied when they're stored and returned, so modifying
+    the prepared datasets in place doesn't change the cached ones."""
+
+    def __init__(self, max_bytes: int, path: Optional[str] = None):
+        if max_bytes < 1:
+            raise ValueError(
+                "The size of the preprocessing cache must be a positive integer."
+            )
+        self.max_bytes = max_bytes
+        self.path = path
+        # key -> size of the entry, from the least to the most recently used
+        self.sizes: OrderedDict[str, int] = OrderedDict()
+        self.values: Dict[str, Any] = {}
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            # resume the entries left by previous sessions
+            files = [f for f in os.scandir(path) if f.name.endswith(".pkl")]
+            for f in sorted(files, key=lambda f: f.stat().st_mtime):
+                self.sizes[f.name[:-4]] = f.stat().st_size
+            self._evict()
+
+    def _file(self, key: str) -> str:
+        assert self.path is not None
+        return os.path.join(self.path, f"{key}.pkl")
+
+    def _evict(self) -> None:
+        total = sum(self.sizes.values())
+        while total > self.max_bytes:
+            key, size = self.sizes.popitem(last=False)
+            total -= size
+            if self.path is None:
+                del self.values[key]
+            elif os.path.exists(self._file(key)):
+                os.remove(self._file(key))
+
+    def get(self, key: str) -> Optional[Any]:
+        if key not in self.sizes:
+            return None
+        self.sizes.move_to_end(key)
+        if self.path is None:
+            return deepcopy(self.values[key])
+        with open(self._file(key), "rb") as f:
+            value = pickle.load(f)
+        os.utime(self._file(key))
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        if self.path is None:
+            size = _approx_nbytes(value)
+        else:
+            data = pickle.dumps(value)
+            size = len(data)
+        if size > self.max_bytes:
+            return None
+        if self.path is None:
+            self.values[key] = deepcopy(value)
+        else:
+            with open(self._file(key), "wb") as f:
+                f.write(data)
+        self.sizes[key] = size
+        self.sizes.move_to_end(key)
+        self._evict()
+
+
+@contextmanager
+def _timed(timings: Dict[str, float], stage: str):
+    # stores the seconds spent in the block as timings[stage]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = time.perf_counter() - start
+
+
+def _categorical_cols(df: DataFrame) -> List[str]:
+    if isinstance(df, pd.DataFrame):
+        return [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    import polars as pl
+
+    return [c for c in df.columns if df[c].dtype in (pl.Categorical, pl.Enum)]
+
+
+def _is_array_input(df) -> bool:
+    # pyarrow tables and (ids, indptr, times, values[, static]) tuples of arrays
+    return isinstance(df, ArrowTable) or (
+        isinstance(df, tuple) and not all(isinstance(x, str) for x in df)
+    )
+
+
+def _is_packed_files(df) -> bool:
+    # directories written by LocalFilesTimeSeriesDataset.pack
+    return isinstance(df, (str, os.PathLike)) and os.path.isfile(
+        os.path.join(df, LocalFilesTimeSeriesDataset.INDEX_FILE)
+    )
+
+
+def _files_list(df) -> Union[str, Sequence[str]]:
+    # the directory of a packed layout or a list of parquet files
+    if _is_packed_files(df):
+        return os.fspath(df)
+    if not all(isinstance(val, str) for val in df):
+        raise ValueError("All entries in the list of files must be of type string")
+    return list(df)
+
+
+def _is_lazy_input(df) -> bool:
+    # polars LazyFrames, pyarrow datasets and paths to parquet datasets
+    if isinstance(df, (str, os.PathLike)):
+        if _is_packed_files(df):
+            return False
+        fs, path = fsspec.core.url_to_fs(os.fspath(df))
+        if not fs.exists(path):
+            raise FileNotFoundError(f"The parquet dataset {df} doesn't exist.")
+        return True
+    return isinstance(df, (PolarsLazyFrame, ArrowDataset))
+
+
+def _tee_columns(batches: Iterator, columns: List[str], out: List) -> Iterator:
+    # yields the record batches and keeps a copy of the given columns in `out`
+    import pyarrow as pa
+
+    for batch in batches:
+        out.append(
+            pa.RecordBatch.from_arrays(
+                [batch.column(c) for c in columns], names=columns
+            )
+        )
+        yield batch
+
+
+def _scan_lazy_frame(
+    lf, columns: List[str], id_col: str, time_col: str, freq, lookback: Optional[int]
+) -> DataFrame:
+    import polars
+
+    lf = lf.select(columns)
+    if lookback is not None:
+        # keep the times of each serie that are less than lookback periods before its last one
+        last = lf.group_by(id_col).agg(polars.col(time_col).max()).collect()
+        cutoffs = last.select(
+            id_col,
+            ufp.offset_times(last[time_col], freq, 1 - lookback).alias("_cutoff"),
+        )
+        lf = (
+            lf.join(cutoffs.lazy(), on=id_col)
+            .filter(polars.col(time_col) >= polars.col("_cutoff"))
+            .drop("_cutoff")
+        )
+    return lf.collect()
+
+
+def _scan_arrow_dataset(
+    dataset,
+    columns: List[str],
+    id_col: str,
+    time_col: str,
+    freq,
+    lookback: Optional[int],
+) -> Iterator:
+    if lookback is None:
+        yield from dataset.to_batches(columns=columns)
+        return
+    import pyarrow as pa
+    import pyarrow.dataset as pds
+
+    last = (
+        dataset.to_table(columns=[id_col, time_col])
+        .group_by(id_col)
+        .aggregate([(time_col, "max")])
+    )
+    uids = pd.Index(last[id_col].to_numpy())
+    last_times = pd.Index(last[f"{time_col}_max"].to_numpy())
+    cutoffs = ufp.offset_times(last_times, freq, 1 - lookback).to_numpy()
+    # the earliest cutoff skips the row groups whose times are all older
+    earliest = pa.array([cutoffs.min()]).cast(dataset.schema.field(time_col).type)
+    batches = dataset.to_batches(
+        columns=columns, filter=pds.field(time_col) >= earliest[0]
+    )
+    for batch in batches:
+        idxs = uids.get_indexer(batch.column(id_col).to_numpy(zero_copy_only=False))
+        times = batch.column(time_col).to_numpy(zero_copy_only=False)
+        yield batch.filter(pa.array(times >= cutoffs[idxs]))
+
+
+def _map_threaded(fn: Callable, items: Sequence) -> List:
+    # the work is done by numpy and coreforecast, which release the GIL
+    if len(items) < 2:
+        return [fn(x) for x in items]
+    n_threads = min(len(items), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        return list(executor.map(fn, items))
+
+
+# fitted models of distributed predict, deserialized once per process and reused by its partitions
+_distributed_predictors: Dict[str, Tuple] = {}
+
+
+def _distributed_predictor(fingerprint: str, payload) -> Tuple:
+    # payload is the broadcast of the pickled models, frequency, local scalers and ids of the scalers
+    if fingerprint not in _distributed_predictors:
+        # only the models of the latest predict are kept
+        _distributed_predictors.clear()
+        models, freq, scalers, scalers_uids = pickle.loads(payload.value)
+        nf = NeuralForecast(models=models, freq=freq)
+        nf._fitted = True
+        _distributed_predictors[fingerprint] = (nf, scalers, scalers_uids)
+    return _distributed_predictors[fingerprint]
+
+
+def _shard_bounds(n_series: int, shard_size: int) -> List[Tuple[int, int]]:
+    return [
+        (start, min(start + shard_size, n_series))
+        for start in range(0, n_series, shard_size)
+    ]
+
+
+def _split_futr_df(
+    futr_df: Optional[DataFrame], uids, bounds: List[Tuple[int, int]], id_col: str
+) -> Iterator[Optional[DataFrame]]:
+    # rows of futr_df of the series of each shard, the ids are mapped to their series once
+    if futr_df is None:
+        for _ in bounds:
+            yield None
+        return
+    pos = pd.Index(np.asarray(uids)).get_indexer(np.asarray(futr_df[id_col]))
+    n_unused = int((pos == -1).sum())
+    if n_unused:
+        warnings.warn(f"Dropped {n_unused:,} unused rows from `futr_df`.")
+    starts = np.array([start for start, _ in bounds])
+    shards = np.where(pos == -1, -1, np.searchsorted(starts, pos, side="right") - 1)
+    order = np.argsort(shards, kind="stable")
+    offsets = np.searchsorted(shards[order], np.arange(len(bounds) + 1))
+    for i in range(len(bounds)):
+        yield ufp.take_rows(futr_df, order[offsets[i] : offsets[i + 1]])
+
+
+def _imap_bounded(
+    executor, fn: Callable, items: Iterator[Tuple[Any, Tuple]], max_in_flight: int
+) -> Iterator[Tuple[Any, Any]]:
+    # (key, fn(*args)) in the order of the (key, args) items, with at most max_in_flight submitted
+    futures: deque = deque()
+    for key, fn_args in items:
+        futures.append((key, executor.submit(fn, *fn_args)))
+        if len(futures) >= max_in_flight:
+            key, future = futures.popleft()
+            yield key, future.result()
+    while futures:
+        key, future = futures.popleft()
+        yield key, future.result()
+
+
+def _write_forecasts(
+    fcsts_dfs: Iterator[DataFrame], path: str, partition_by: Optional[List[str]] = None
+) -> str:
+    # each frame is written as soon as it's produced, to its own file or to the partitions of its rows
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    fs, fs_path = fsspec.core.url_to_fs(path)
+    # the files of a previous run would be read as part of the dataset
+    if fs.exists(fs_path) and fs.ls(fs_path):
+        raise ValueError(
+            f"The directory {path} isn't empty, the forecasts must be written to an empty directory."
+        )
+    fs.makedirs(fs_path, exist_ok=True)
+    for shard, fcsts_df in enumerate(fcsts_dfs):
+        if isinstance(fcsts_df, pl_DataFrame):
+            table = fcsts_df.to_arrow()
+        else:
+            table = pa.Table.from_pandas(fcsts_df, preserve_index=False)
+        if partition_by is None:
+            pq.write_table(table, f"{fs_path}/part-{shard:05d}.parquet", filesystem=fs)
+        else:
+            pq.write_to_dataset(
+                table,
+                root_path=fs_path,
+                partition_cols=partition_by,
+                filesystem=fs,
+                basename_template=f"part-{shard:05d}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+    return path
+
+
+def _to_pandas(df: Optional[DataFrame]) -> Optional[pd.DataFrame]:
+    if isinstance(df, pl_DataFrame):
+        return df.to_pandas()
+    return df
+
+
+# models of the processes of sharded predict, set once when each process starts
+_predict_worker_state: Dict[str, Any] = {}
+
+
+def _init_predict_worker(nf, num_threads: int) -> None:
+    torch.set_num_threads(num_threads)
+    _predict_worker_state["nf"] = nf
+
+
+def _predict_shard_worker(
+    dataset: TimeSeriesDataset,
+    uids: np.ndarray,
+    scalers: Dict[str, Any],
+    cs_df: Optional[pd.DataFrame],
+    predict_kwargs: Dict[str, Any],
+) -> Tuple[np.ndarray, List[str]]:
+    nf = copy(_predict_worker_state["nf"])
+    nf.scalers_ = scalers
+    nf._cs_df = cs_df
+    return nf._forecast_values(dataset, uids, **predict_kwargs)
+
+
+def _forecasts_frame(
+    fcsts_df: DataFrame, fcsts: np.ndarray, cols: List[str]
+) -> DataFrame:
+    # adds the forecasts to the frame with their ids and times
+    if isinstance(fcsts_df, pl_DataFrame):
+        values_df = pl_DataFrame(dict(zip(cols, fcsts.T)))
+    else:
+        values_df = pd.DataFrame(fcsts, columns=cols)
+    return ufp.horizontal_concat([fcsts_df, values_df])
+
+
+def _concat_forecast_arrays(arrays: List["ForecastArrays"]) -> "ForecastArrays":
+    # forecasts of consecutive shards of series
+    shards_last_dates = [a.last_dates for a in arrays]
+    if isinstance(shards_last_dates[0], pd.Index):
+        last_dates = shards_last_dates[0].append(shards_last_dates[1:])
+    else:
+        last_dates = ufp.vertical_concat(shards_last_dates)
+    return arrays[0]._replace(
+        forecasts=np.concatenate([a.forecasts for a in arrays]),
+        uids=ufp.vertical_concat([a.uids for a in arrays]),
+        last_dates=last_dates,
+    )
+
+
+def _fixed_step(freq: Union[str, int, pd.offsets.BaseOffset], df: DataFrame):
+    # distance between consecutive times if it doesn't depend on the dates, None otherwise
+    if isinstance(freq, int):
+        return freq
+    if isinstance(df, pl_DataFrame):
+        # polars durations of fixed length, months, quarters and years depend on the dates
+        if not isinstance(freq, str) or not re.fullmatch(
+            r"(\d+(ns|us|ms|s|m|h|d|w))+", freq
+        ):
+            return None
+        return pd.Timedelta(freq).to_timedelta64()
+    offset = pd.tseries.frequencies.to_offset(freq)
+    if not isinstance(offset, pd.offsets.Tick):
+        return None
+    return pd.Timedelta(offset).to_timedelta64()
+
+
+def _future_slots(
+    futr_df: DataFrame,
+    uids: Series,
+    last_dates,
+    freq: Union[str, int, pd.offsets.BaseOffset],
+    h: int,
+    id_col: str,
+    time_col: str,
+) -> Optional[np.ndarray]:
+    # slot of each row of futr_df in the future samples of the series, serie * h + step,
+    # -1 for the rows of other series or times. None if the times can't be mapped with the frequency
+    step = _fixed_step(freq, futr_df)
+    if step is None:
+        return None
+    times = np.asarray(futr_df[time_col])
+    last_times = np.asarray(last_dates)
+    if isinstance(step, np.timedelta64):
+        if times.dtype.kind != "M" or last_times.dtype.kind != "M":
+            return None
+        times = times.astype("datetime64[ns]").view(np.int64)
+        last_times = last_times.astype("datetime64[ns]").view(np.int64)
+        step = step // np.timedelta64(1, "ns")
+    elif times.dtype.kind not in "iu" or last_times.dtype.kind not in "iu":
+        return None
+    series = pd.Index(np.asarray(uids)).get_indexer(np.asarray(futr_df[id_col]))
+    steps, remainders = np.divmod(times - last_times[series], step)
+    used = (series >= 0) & (remainders == 0) & (steps >= 1) & (steps <= h)
+    return np.where(used, series * h + steps - 1, -1)
+
 # %% ../nbs/core.ipynb 7
 MODEL_FILENAME_DICT = {
     "autoformer": Autoformer,
@@ -213,7 +778,47 @@ _type2scaler = {
     "boxcox": lambda: LocalBoxCoxScaler(method="loglik", lower=0.0),
 }
 
+# series read per shard when fitting the local scalers of datasets that don't fit in memory
+_FILES_SHARD_SIZE = 10_000
+
+
+def _stack_scalers(scalers):
+    # concatenates the statistics of local scalers fitted on different shards of series
+    return {
+        col: type(scaler).stack([shard_scalers[col] for shard_scalers in scalers])
+        for col, scaler in scalers[0].items()
+    }
+
 # %% ../nbs/core.ipynb 9
+class ForecastArrays(NamedTuple):
+    """Forecasts of `NeuralForecast.predict` with `output='arrays'`.
+
+    `forecasts` has shape `(n_series, h, n_cols)` and the forecasts of the i-th serie of `uids`
+    are at the `h` times that follow `last_dates[i]` with frequency `freq`.
+    The frame with the ids and times of the forecasts is only built by `to_frame`."""
+
+    forecasts: np.ndarray
+    columns: List[str]
+    uids: Series
+    last_dates: Union[pd.Index, Series]
+    freq: Union[str, int, pd.offsets.BaseOffset]
+    id_col: str = "unique_id"
+    time_col: str = "ds"
+
+    def to_frame(self) -> DataFrame:
+        """Forecasts in the DataFrame returned by `predict`."""
+        fcsts_df = ufp.make_future_dataframe(
+            uids=self.uids,
+            last_times=self.last_dates,
+            freq=self.freq,
+            h=self.forecasts.shape[1],
+            id_col=self.id_col,
+            time_col=self.time_col,
+        )
+        fcsts = self.forecasts.reshape(-1, len(self.columns))
+        return _forecasts_frame(fcsts_df, fcsts, self.columns)
+
+
 class NeuralForecast:
 
     def __init__(
@@ -221,6 +826,9 @@ class NeuralForecast:
         models: List[Any],
         freq: Union[str, int],
         local_scaler_type: Optional[str] = None,
+        compact_times: bool = False,
+        preprocessing_cache_size: Optional[int] = None,
+        preprocessing_cache_dir: Optional[str] = None,
     ):
         """
         The `core.StatsForecast` class allows you to efficiently fit multiple `NeuralForecast` models
@@ -238,6 +846,15 @@ class NeuralForecast:
         local_scaler_type : str, optional (default=None)
             Scaler to apply per-serie to all features before fitting, which is inverted after predicting.
             Can be 'standard', 'robust', 'robust-iqr', 'minmax' or 'boxcox'
+        compact_times : bool (default=False)
+            Store the timestamps of the training data as the start of each serie in a grid of
+            unique timestamps instead of the full array. Falls back to the full array if the series have gaps.
+        preprocessing_cache_size : int, optional (default=None)
+            Maximum size in bytes of the cache of prepared datasets, which is reused when `fit`, `predict` or
+            `cross_validation` receive the same frames again. The frames are identified by their schema and
+            the hashes of a sample of their rows. If None, the cache is disabled.
+        preprocessing_cache_dir : str, optional (default=None)
+            Directory where the cached datasets are pickled. If None, they're kept in memory.
 
         Returns
         -------
@@ -254,7 +871,16 @@ class NeuralForecast:
         if local_scaler_type is not None and local_scaler_type not in _type2scaler:
             raise ValueError(f"scaler_type must be one of {_type2scaler.keys()}")
         self.local_scaler_type = local_scaler_type
+        self.compact_times = compact_times
+        self.preprocessing_cache_size = preprocessing_cache_size
+        self.preprocessing_cache_dir = preprocessing_cache_dir
+        self._preprocessing_cache: Optional[_PreprocessingCache] = None
+        if preprocessing_cache_size is not None:
+            self._preprocessing_cache = _PreprocessingCache(
+                preprocessing_cache_size, preprocessing_cache_dir
+            )
         self.scalers_: Dict
+        self.preprocessing_times_: Dict[str, float] = {}
 
         # Flags and attributes
         self._fitted = False
@@ -265,74 +891,230 @@ class NeuralForecast:
         self.scalers_ = {}
         if self.local_scaler_type is None:
             return None
-        for i, col in enumerate(dataset.temporal_cols):
-            if col == "available_mask":
-                continue
+        cols = [col for col in dataset.temporal_cols if col != "available_mask"]
+
+        def fit_transform(col):
+            # each thread reads and writes a different column of the buffer
+            i = dataset.temporal_cols.get_loc(col)
+            ga = GroupedArray(dataset.temporal[:, i].numpy(), dataset.indptr)
+            scaler = _type2scaler[self.local_scaler_type]().fit(ga)
+            dataset.temporal[:, i] = torch.from_numpy(scaler.transform(ga))
+            return scaler
+
+        self.scalers_ = dict(zip(cols, _map_threaded(fit_transform, cols)))
+
+    def _scalers_fit(self, dataset: TimeSeriesDataset) -> Dict[str, Any]:
+        # only computes the statistics, for the first pass over series that don't fit in memory
+        cols = [col for col in dataset.temporal_cols if col != "available_mask"]
+
+        def fit(col):
+            i = dataset.temporal_cols.get_loc(col)
             ga = GroupedArray(dataset.temporal[:, i].numpy(), dataset.indptr)
-            self.scalers_[col] = _type2scaler[self.local_scaler_type]().fit(ga)
-            dataset.temporal[:, i] = torch.from_numpy(self.scalers_[col].transform(ga))
+            return _type2scaler[self.local_scaler_type]().fit(ga)
+
+        return dict(zip(cols, _map_threaded(fit, cols)))
 
-    def _scalers_transform(self, dataset: TimeSeriesDataset) -> None:
-        if not self.scalers_:
+    def _scalers_transform(
+        self, dataset: TimeSeriesDataset, scalers: Optional[Dict] = None
+    ) -> None:
+        scalers = self.scalers_ if scalers is None else scalers
+        if not scalers:
             return None
-        for i, col in enumerate(dataset.temporal_cols):
-            scaler = self.scalers_.get(col, None)
-            if scaler is None:
-                continue
+        cols = [col for col in dataset.temporal_cols if col in scalers]
+
+        def transform(col):
+            i = dataset.temporal_cols.get_loc(col)
             ga = GroupedArray(dataset.temporal[:, i].numpy(), dataset.indptr)
-            dataset.temporal[:, i] = torch.from_numpy(scaler.transform(ga))
+            dataset.temporal[:, i] = torch.from_numpy(scalers[col].transform(ga))
+
+        _map_threaded(transform, cols)
 
     def _scalers_target_inverse_transform(
-        self, data: np.ndarray, indptr: np.ndarray
+        self, data: np.ndarray, indptr: np.ndarray, scalers: Optional[Dict] = None
     ) -> np.ndarray:
-        if not self.scalers_:
+        scalers = self.scalers_ if scalers is None else scalers
+        if not scalers:
             return data
         for i in range(data.shape[1]):
             ga = GroupedArray(data[:, i], indptr)
-            data[:, i] = self.scalers_[self.target_col].inverse_transform(ga)
+            data[:, i] = scalers[self.target_col].inverse_transform(ga)
         return data
 
-    def _prepare_fit(self, df, static_df, predict_only, id_col, time_col, target_col):
+    def _prepare_fit(
+        self,
+        df,
+        static_df,
+        predict_only,
+        id_col,
+        time_col,
+        target_col,
+        lookback: Optional[int] = None,
+    ):
         # TODO: uids, last_dates and ds should be properties of the dataset class. See github issue.
         self.id_col = id_col
         self.time_col = time_col
         self.target_col = target_col
-        self._check_nan(df, static_df, id_col, time_col, target_col)
+        timings = self.preprocessing_times_ = {}
+        if _is_lazy_input(df):
+            with _timed(timings, "scan"):
+                df = self._scan_lazy(df, id_col, time_col, target_col, lookback)
+        cache_key = None
+        cacheable = isinstance(df, (pd.DataFrame, pl_DataFrame)) and not isinstance(
+            static_df, ArrowTable
+        )
+        if self._preprocessing_cache is not None and cacheable:
+            with _timed(timings, "cache"):
+                cache_key = self._preprocessing_cache_key(
+                    df, static_df, predict_only, id_col, time_col, target_col
+                )
+                cached = self._preprocessing_cache.get(cache_key)
+            if cached is not None:
+                prepared, scalers = cached
+                if not predict_only:
+                    self.scalers_ = scalers
+                return prepared
+        # a single pass over the frame, the checks and the scalers run on its buffers
+        with _timed(timings, "process_df"):
+            dataset, uids, last_dates, ds = self._dataset_from_input(
+                df=df,
+                static_df=static_df,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+        with _timed(timings, "validate_freq"):
+            validate_freq(last_dates, self.freq)
+        with _timed(timings, "check_nan"):
+            self._check_nan(dataset, df, static_df)
+        with _timed(timings, "scalers"):
+            if predict_only:
+                self._scalers_transform(dataset)
+            else:
+                self._scalers_fit_transform(dataset)
+        if not predict_only:
+            ds = self._maybe_compact_times(ds, dataset.indptr)
+        if cache_key is not None and self._preprocessing_cache is not None:
+            scalers = None if predict_only else self.scalers_
+            self._preprocessing_cache.put(
+                cache_key, ((dataset, uids, last_dates, ds), scalers)
+            )
+        return dataset, uids, last_dates, ds
 
-        dataset, uids, last_dates, ds = TimeSeriesDataset.from_df(
+    def _dataset_from_input(self, df, static_df, id_col, time_col, target_col):
+        if isinstance(df, ArrowTable):
+            return TimeSeriesDataset.from_arrow(
+                table=df,
+                static_df=static_df,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+        if isinstance(df, Iterator):
+            # record batches of a pyarrow dataset
+            return TimeSeriesDataset.from_batches(
+                batches=df,
+                static_df=static_df,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+        if isinstance(df, tuple):
+            if static_df is not None:
+                raise ValueError(
+                    "The static features of arrays must be passed in their `static` field."
+                )
+            # the local scalers transform the dataset in place
+            return TimeSeriesDataset.from_arrays(
+                arrays=TimeSeriesArrays(*df),
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                copy=self.local_scaler_type is not None,
+            )
+        return TimeSeriesDataset.from_df(
             df=df,
             static_df=static_df,
             id_col=id_col,
             time_col=time_col,
             target_col=target_col,
         )
-        if predict_only:
-            self._scalers_transform(dataset)
-        else:
-            self._scalers_fit_transform(dataset)
-        return dataset, uids, last_dates, ds
-
-    def _check_nan(self, df, static_df, id_col, time_col, target_col):
-        cols_with_nans = []
 
-        temporal_cols = [target_col] + [
-            c for c in df.columns if c not in (id_col, time_col, target_col)
+    def _scan_lazy(self, df, id_col, time_col, target_col, lookback=None):
+        # only the columns used by the models are read and, when a lookback is given,
+        # only the last times of each serie. Polars inputs are collected into a frame
+        # and pyarrow datasets are returned as an iterator of record batches.
+        needed = {id_col, time_col, target_col, "available_mask"}
+        needed |= self._get_needed_exog()
+        if isinstance(df, PolarsLazyFrame):
+            columns = [c for c in df.collect_schema().names() if c in needed]
+            return _scan_lazy_frame(df, columns, id_col, time_col, self.freq, lookback)
+        if not isinstance(df, ArrowDataset):
+            import pyarrow.dataset as pds
+
+            df = pds.dataset(df, format="parquet")
+        columns = [c for c in df.schema.names if c in needed]
+        return _scan_arrow_dataset(df, columns, id_col, time_col, self.freq, lookback)
+
+    def _preprocessing_cache_key(
+        self, df, static_df, predict_only, id_col, time_col, target_col
+    ):
+        params = [
+            str(self.freq),
+            self.local_scaler_type,
+            self.compact_times,
+            predict_only,
+            id_col,
+            time_col,
+            target_col,
         ]
-        if "available_mask" in temporal_cols:
-            available_mask = df["available_mask"].to_numpy().astype(bool)
-        else:
-            available_mask = np.full(df.shape[0], True)
-
-        df_to_check = ufp.filter_with_mask(df, available_mask)
-        for col in temporal_cols:
-            if ufp.is_nan_or_none(df_to_check[col]).any():
-                cols_with_nans.append(col)
+        if predict_only and self.scalers_:
+            # the transformation depends on the fitted scalers
+            params.append(hashlib.sha1(pickle.dumps(self.scalers_)).hexdigest())
+        key = repr([_frame_fingerprint(df), _frame_fingerprint(static_df), params])
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def _print_preprocessing_times(self) -> None:
+        times = [f"{k}: {v:.3f}s" for k, v in self.preprocessing_times_.items()]
+        print(f"Preprocessing times: {', '.join(times)}.")
+
+    def _print_shards_imbalance(self) -> None:
+        print(
+            f"Shards imbalance (samples of the largest shard over the mean): {self.shards_imbalance_:.3f}."
+        )
 
-        if static_df is not None:
-            for col in [x for x in static_df.columns if x != id_col]:
-                if ufp.is_nan_or_none(static_df[col]).any():
-                    cols_with_nans.append(col)
+    def _maybe_compact_times(self, ds, indptr):
+        if not self.compact_times or isinstance(ds, _CompactTimes):
+            return ds
+        compact = _CompactTimes.from_times(ds, indptr)
+        return ds if compact is None else compact
+
+    def _check_nan(self, dataset: TimeSeriesDataset, df, static_df) -> None:
+        # only the rows flagged by the available mask are checked
+        temporal = dataset.temporal.numpy()
+        available = temporal[:, dataset.temporal_cols.get_loc("available_mask")] != 0
+        is_nan = np.isnan(temporal)
+        if not available.all():
+            is_nan &= available[:, None]
+        has_nans = dict(zip(dataset.temporal_cols, is_nan.any(axis=0)))
+        if dataset.static is not None:
+            is_nan = np.isnan(dataset.static.numpy())
+            has_nans.update(zip(dataset.static_cols, is_nan.any(axis=0)))
+
+        # categoricals are stored as codes, so their nulls are searched in the frames
+        for frame in (df, static_df):
+            if not isinstance(frame, (pd.DataFrame, pl_DataFrame)):
+                continue
+            cat_cols = [c for c in _categorical_cols(frame) if c in has_nans]
+            if not cat_cols:
+                continue
+            is_nan = np.column_stack(
+                [ufp.is_none(frame[c]).to_numpy() for c in cat_cols]
+            )
+            if frame is df and "available_mask" in frame.columns:
+                is_nan &= frame["available_mask"].to_numpy().astype(bool)[:, None]
+            has_nans.update(zip(cat_cols, is_nan.any(axis=0)))
 
+        cols_with_nans = [col for col, has_nan in has_nans.items() if has_nan]
         if cols_with_nans:
             raise ValueError(f"Found missing values in {cols_with_nans}.")
 
@@ -343,17 +1125,15 @@ class NeuralForecast:
         id_col: str,
         time_col: str,
         target_col: str,
-        distributed_config: Optional[DistributedConfig],
+        distributed_config: Optional[Union[DistributedConfig, LocalDistributedConfig]],
     ):
-        if distributed_config is None:
-            raise ValueError(
-                "Must set `distributed_config` when using a spark dataframe"
-            )
-        if self.local_scaler_type is not None:
+        # the local config is rejected here, it doesn't use spark
+        if not isinstance(distributed_config, DistributedConfig):
             raise ValueError(
-                "Historic scaling isn't supported in distributed. "
-                "Please open an issue if this would be valuable to you."
+                "Must set a `DistributedConfig` when using a spark dataframe"
             )
+        from pyspark.sql.functions import broadcast
+
         temporal_cols = [c for c in df.columns if c not in (id_col, time_col)]
         if static_df is not None:
             static_cols = [c for c in static_df.columns if c != id_col]
@@ -365,68 +1145,136 @@ class NeuralForecast:
         self.target_col = target_col
         self.scalers_ = {}
         num_partitions = distributed_config.num_nodes * distributed_config.devices
-        df = df.repartitionByRange(num_partitions, id_col)
-        df.write.parquet(path=distributed_config.partitions_path, mode="overwrite")
+        # assign the series to the partitions balancing their number of samples
+        counts = df.groupBy(id_col).count().toPandas()
+        if counts.shape[0] < num_partitions:
+            raise ValueError(
+                f"There are fewer series ({counts.shape[0]:,}) than processes ({num_partitions})."
+            )
+        sizes = counts["count"].to_numpy()
+        counts["_shard"] = _balance_shards(sizes, num_partitions)
+        self.shards_imbalance_ = _shards_imbalance(
+            sizes, counts["_shard"].to_numpy(), num_partitions
+        )
+        assignment = df.sparkSession.createDataFrame(counts[[id_col, "_shard"]])
+        # sorted so that the ranks don't reorder the rows of their partition
+        df = (
+            df.join(broadcast(assignment), on=id_col)
+            .repartition(num_partitions, "_shard")
+            .sortWithinPartitions(id_col, time_col)
+        )
+        df.write.partitionBy("_shard").parquet(
+            path=distributed_config.partitions_path, mode="overwrite"
+        )
+        # the assignment is kept next to the partitions, which don't read it
+        counts.to_parquet(
+            f"{distributed_config.partitions_path}/_shards.parquet", index=False
+        )
         fs, _, _ = fsspec.get_fs_token_paths(distributed_config.partitions_path)
         protocol = fs.protocol
         if isinstance(protocol, tuple):
             protocol = protocol[0]
-        files = [
-            f"{protocol}://{file}"
-            for file in fs.ls(distributed_config.partitions_path)
-            if file.endswith("parquet")
-        ]
-        return _FilesDataset(
+        shard_dirs = {
+            int(path.rsplit("=", 1)[1]): path
+            for path in fs.ls(distributed_config.partitions_path)
+            if "_shard=" in path
+        }
+        # each rank reads the directory of its shard
+        files = [f"{protocol}://{shard_dirs[shard]}" for shard in range(num_partitions)]
+        files_ds = _FilesDataset(
             files=files,
             temporal_cols=temporal_cols,
             static_cols=static_cols,
             id_col=id_col,
             time_col=time_col,
             target_col=target_col,
-            min_size=df.groupBy(id_col).count().agg({"count": "min"}).first()[0],
+            min_size=int(sizes.min()),
         )
+        if self.local_scaler_type is not None:
+            # first pass over the partitions, only the statistics of their series are kept
+            files_ds.scalers, files_ds.scalers_uids = [], []
+            for i in range(len(files)):
+                dataset, uids, _, _ = files_ds.read(i, with_static=False)
+                files_ds.scalers.append(self._scalers_fit(dataset))
+                files_ds.scalers_uids.append(np.asarray(uids))
+            self.scalers_ = _stack_scalers(files_ds.scalers)
+        return files_ds
 
     def _prepare_fit_for_local_files(
         self,
-        files_list: Sequence[str],
+        files_list: Union[str, Sequence[str]],
         static_df: Optional[DataFrame],
         id_col: str,
         time_col: str,
         target_col: str,
     ):
-        if self.local_scaler_type is not None:
-            raise ValueError(
-                "Historic scaling isn't supported when the dataset is split between files. "
-                "Please open an issue if this would be valuable to you."
-            )
-
         self.id_col = id_col
         self.time_col = time_col
         self.target_col = target_col
         self.scalers_ = {}
 
         exogs = self._get_needed_exog()
-        return LocalFilesTimeSeriesDataset.from_data_directories(
-            directories=files_list,
-            static_df=static_df,
-            exogs=exogs,
-            id_col=id_col,
-            time_col=time_col,
-            target_col=target_col,
-        )
+        if _is_packed_files(files_list):
+            dataset = LocalFilesTimeSeriesDataset.from_packed(
+                path=files_list,
+                static_df=static_df,
+                exogs=exogs,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+        else:
+            dataset = LocalFilesTimeSeriesDataset.from_data_directories(
+                directories=files_list,
+                static_df=static_df,
+                exogs=exogs,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+        if self.local_scaler_type is not None:
+            # first pass over the files, only the statistics of each serie are kept
+            n_series = len(dataset)
+            self.scalers_ = _stack_scalers(
+                [
+                    self._scalers_fit(
+                        dataset.read_tails(
+                            np.arange(start, min(start + _FILES_SHARD_SIZE, n_series))
+                        )
+                    )
+                    for start in range(0, n_series, _FILES_SHARD_SIZE)
+                ]
+            )
+            # the series are scaled as they're read
+            dataset.scalers = self.scalers_
+        return dataset
 
     def fit(
         self,
-        df: Optional[Union[DataFrame, SparkDataFrame, Sequence[str]]] = None,
-        static_df: Optional[Union[DataFrame, SparkDataFrame]] = None,
+        df: Optional[
+            Union[
+                DataFrame,
+                SparkDataFrame,
+                ArrowTable,
+                TimeSeriesArrays,
+                PolarsLazyFrame,
+                ArrowDataset,
+                str,
+                Sequence[str],
+            ]
+        ] = None,
+        static_df: Optional[Union[DataFrame, SparkDataFrame, ArrowTable]] = None,
         val_size: Optional[int] = 0,
         use_init_models: bool = False,
         verbose: bool = False,
         id_col: str = "unique_id",
         time_col: str = "ds",
         target_col: str = "y",
-        distributed_config: Optional[DistributedConfig] = None,
+        distributed_config: Optional[
+            Union[DistributedConfig, LocalDistributedConfig]
+        ] = None,
         prediction_intervals: Optional[PredictionIntervals] = None,
+        retain: str = "all",
     ) -> None:
         """Fit the core.NeuralForecast.
 
@@ -435,10 +1283,15 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas, polars or spark DataFrame, or a list of parquet files containing the series, optional (default=None)
+        df : pandas, polars or spark DataFrame, pyarrow Table, TimeSeriesArrays, polars LazyFrame, pyarrow Dataset, path to a parquet dataset, or a list of parquet files containing the series or the directory of their packed layout, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
+            A pyarrow Table or a `TimeSeriesArrays` tuple must be sorted by id and time and are
+            converted to the dataset without going through a DataFrame.
+            Only the columns used by the models are read from a polars LazyFrame or a pyarrow Dataset,
+            whose batches are written to the dataset as they're read.
+            A directory written by `LocalFilesTimeSeriesDataset.pack` is read one serie at a time, like the list of files.
             If None, a previously stored dataset is required.
-        static_df : pandas, polars or spark DataFrame, optional (default=None)
+        static_df : pandas, polars or spark DataFrame or pyarrow Table, optional (default=None)
             DataFrame with columns [`unique_id`] and static exogenous.
         val_size : int, optional (default=0)
             Size of validation set.
@@ -452,10 +1305,15 @@ class NeuralForecast:
             Column that identifies each timestep, its values can be timestamps or integers.
         target_col : str (default='y')
             Column that contains the target.
-        distributed_config : neuralforecast.DistributedConfig
-            Configuration to use for DDP training. Currently only spark is supported.
+        distributed_config : neuralforecast.DistributedConfig or neuralforecast.LocalDistributedConfig, optional (default=None)
+            Configuration to use for DDP training. A `DistributedConfig` trains on a spark DataFrame with spark's TorchDistributor,
+            a `LocalDistributedConfig` trains on several processes of this machine, each with a shard of the series.
         prediction_intervals : PredictionIntervals, optional (default=None)
             Configuration to calibrate prediction intervals (Conformal Prediction).
+        retain : str (default='all')
+            Samples of the dataset that are stored after fitting.
+            If 'all', the full dataset is kept. If 'tail', only the last samples of each serie
+            that the models use to predict are kept, see `compact`.
 
         Returns
         -------
@@ -465,6 +1323,23 @@ class NeuralForecast:
         if (df is None) and not (hasattr(self, "dataset")):
             raise Exception("You must pass a DataFrame or have one stored.")
 
+        if retain not in ("all", "tail"):
+            raise ValueError(f"retain must be one of ['all', 'tail'], got: {retain}")
+        if retain == "tail":
+            # checked before training, the other datasets can't be compacted afterwards
+            builds_dataset = (
+                isinstance(df, (pd.DataFrame, pl_DataFrame))
+                or _is_array_input(df)
+                or _is_lazy_input(df)
+            )
+            stored_dataset = df is None and isinstance(
+                getattr(self, "dataset", None), TimeSeriesDataset
+            )
+            if not (builds_dataset or stored_dataset):
+                raise ValueError(
+                    "`retain='tail'` is only supported for datasets built from a DataFrame."
+                )
+
         # Model and datasets interactions protections
         if (
             any(model.early_stop_patience_steps > 0 for model in self.models)
@@ -481,8 +1356,11 @@ class NeuralForecast:
         self.prediction_intervals: Optional[PredictionIntervals] = None
 
         # Process and save new dataset (in self)
-        if isinstance(df, (pd.DataFrame, pl_DataFrame)):
-            validate_freq(df[time_col], self.freq)
+        if (
+            isinstance(df, (pd.DataFrame, pl_DataFrame))
+            or _is_array_input(df)
+            or _is_lazy_input(df)
+        ):
             self.dataset, self.uids, self.last_dates, self.ds = self._prepare_fit(
                 df=df,
                 static_df=static_df,
@@ -491,7 +1369,13 @@ class NeuralForecast:
                 time_col=time_col,
                 target_col=target_col,
             )
+            if verbose:
+                self._print_preprocessing_times()
             if prediction_intervals is not None:
+                if _is_array_input(df) or _is_lazy_input(df):
+                    raise NotImplementedError(
+                        "Prediction intervals are not supported for pyarrow, array or lazy inputs."
+                    )
                 self.prediction_intervals = prediction_intervals
                 self._cs_df = self._conformity_scores(
                     df=df,
@@ -514,19 +1398,17 @@ class NeuralForecast:
                 target_col=target_col,
                 distributed_config=distributed_config,
             )
+            if verbose:
+                self._print_shards_imbalance()
 
             if prediction_intervals is not None:
                 raise NotImplementedError(
                     "Prediction intervals are not supported for distributed training."
                 )
 
-        elif isinstance(df, Sequence):
-            if not all(isinstance(val, str) for val in df):
-                raise ValueError(
-                    "All entries in the list of files must be of type string"
-                )
+        elif _is_packed_files(df) or isinstance(df, Sequence):
             self.dataset = self._prepare_fit_for_local_files(
-                files_list=df,
+                files_list=_files_list(df),
                 static_df=static_df,
                 id_col=id_col,
                 time_col=time_col,
@@ -545,7 +1427,7 @@ class NeuralForecast:
                 print("Using stored dataset.")
         else:
             raise ValueError(
-                f"`df` must be a pandas, polars or spark DataFrame, or a list of parquet files containing the series, or `None`, got: {type(df)}"
+                f"`df` must be a pandas, polars or spark DataFrame, a pyarrow Table, a TimeSeriesArrays tuple, a polars LazyFrame, a pyarrow Dataset or the path to one, a list of parquet files containing the series or the directory of their packed layout, or `None`, got: {type(df)}"
             )
 
         if val_size is not None:
@@ -558,12 +1440,76 @@ class NeuralForecast:
         if use_init_models:
             self._reset_models()
 
+        if (
+            isinstance(distributed_config, LocalDistributedConfig)
+            and distributed_config.shards is None
+        ):
+            # the series are assigned once, every model trains on the same shards
+            distributed_config = replace(
+                distributed_config,
+                shards=_balance_shards(
+                    _series_sizes(self.dataset), distributed_config.num_processes
+                ),
+            )
+
         for i, model in enumerate(self.models):
             self.models[i] = model.fit(
                 self.dataset, val_size=val_size, distributed_config=distributed_config
             )
 
+        if isinstance(distributed_config, LocalDistributedConfig):
+            self.shards_ = np.asarray(distributed_config.shards)
+            self.shards_imbalance_ = _shards_imbalance(
+                _series_sizes(self.dataset),
+                self.shards_,
+                distributed_config.num_processes,
+            )
+            if verbose:
+                self._print_shards_imbalance()
+
         self._fitted = True
+        if retain == "tail":
+            self.compact()
+
+    def compact(self) -> None:
+        """Keep only the samples of the stored dataset that the models use to predict.
+
+        The stored dataset and its times are reduced to the last samples of each serie,
+        determined by the largest input size of the models. The local scalers and the conformity
+        scores are computed during fit, so `predict` without `df` keeps producing the same forecasts,
+        while methods that use the whole history, like `predict_insample`, only see the retained samples.
+        """
+        if not self._fitted:
+            raise Exception("You must fit the model first.")
+        if not isinstance(self.dataset, TimeSeriesDataset):
+            raise ValueError("Only datasets built from a DataFrame can be compacted.")
+        lookback = self._predict_lookback()
+        if lookback is None:
+            warnings.warn(
+                "The input size of some models can't be determined, keeping the whole dataset."
+            )
+            return
+        sizes = np.diff(self.dataset.indptr)
+        tail_sizes = np.minimum(sizes, lookback)
+        tails_indptr = np.append(0, tail_sizes.cumsum()).astype(
+            self.dataset.indptr.dtype
+        )
+        idxs = np.repeat(
+            self.dataset.indptr[1:] - tail_sizes - tails_indptr[:-1], tail_sizes
+        ) + np.arange(tails_indptr[-1])
+        self.dataset = TimeSeriesDataset(
+            temporal=self.dataset.temporal[idxs],
+            temporal_cols=self.dataset.temporal_cols,
+            indptr=tails_indptr,
+            y_idx=self.dataset.y_idx,
+            static=self.dataset.static,
+            static_cols=self.dataset.static_cols,
+        )
+        if isinstance(self.ds, _CompactTimes):
+            # the tails are taken from the grid, without materializing the times
+            self.ds = self.ds.take_series_rows(sizes - tail_sizes, tail_sizes)
+        else:
+            self.ds = self._maybe_compact_times(self.ds[idxs], tails_indptr)
 
     def make_future_dataframe(self, df: Optional[DFType] = None) -> DFType:
         """Create a dataframe with all ids and future times in the forecasting horizon.
@@ -693,38 +1639,41 @@ class NeuralForecast:
             df: pd.DataFrame,
             static_cols,
             futr_exog_cols,
-            models,
-            freq,
+            fingerprint,
+            payload,
             id_col,
             time_col,
             target_col,
         ) -> pd.DataFrame:
-            from neuralforecast import NeuralForecast
-
-            nf = NeuralForecast(models=models, freq=freq)
+            # doesn't reference self, which would be serialized with every task
+            nf, scalers, scalers_uids = _distributed_predictor(fingerprint, payload)
             nf.id_col = id_col
             nf.time_col = time_col
             nf.target_col = target_col
             nf.scalers_ = {}
-            nf._fitted = True
             if futr_exog_cols:
                 # if we have futr_exog we'll have extra rows with the future values
                 futr_rows = df[target_col].isnull()
-                futr_df = df.loc[
-                    futr_rows, [self.id_col, self.time_col] + futr_exog_cols
-                ].copy()
+                futr_df = df.loc[futr_rows, [id_col, time_col] + futr_exog_cols].copy()
                 df = df[~futr_rows].copy()
             else:
                 futr_df = None
             if static_cols:
                 static_df = (
-                    df[[self.id_col] + static_cols]
-                    .groupby(self.id_col, observed=True)
-                    .head(1)
+                    df[[id_col] + static_cols].groupby(id_col, observed=True).head(1)
                 )
                 df = df.drop(columns=static_cols)
             else:
                 static_df = None
+            if scalers:
+                # the statistics of the series in this partition
+                uids = ufp.counts_by_id(df, id_col)[id_col]
+                idxs = pd.Index(scalers_uids).get_indexer(uids)
+                if (idxs < 0).any():
+                    raise ValueError(
+                        "Found series that weren't seen during training, their local scalers are unknown."
+                    )
+                nf.scalers_ = _take_scalers(scalers, idxs)
             return nf.predict(df=df, static_df=static_df, futr_df=futr_df)
 
         # df
@@ -774,6 +1723,20 @@ class NeuralForecast:
         if repartition:
             df = df.repartitionByRange(df.rdd.getNumPartitions(), self.id_col)
 
+        # the local scalers are sent along with the ids of their series
+        scalers_uids = None
+        if self.scalers_:
+            if isinstance(self.dataset, _FilesDataset):
+                # set together with the scalers of the partitions
+                assert self.dataset.scalers_uids is not None
+                scalers_uids = np.concatenate(self.dataset.scalers_uids)
+            else:
+                scalers_uids = np.asarray(self.uids)
+        # the models are serialized and broadcast once, each executor deserializes them once
+        payload = pickle.dumps((self.models, self.freq, self.scalers_, scalers_uids))
+        fingerprint = hashlib.sha256(payload).hexdigest()
+        payload = df.sparkSession.sparkContext.broadcast(payload)
+
         # predict
         base_schema = fa.get_schema(df).extract([self.id_col, self.time_col])
         models_schema = {model: "float" for model in self._get_model_names()}
@@ -784,8 +1747,8 @@ class NeuralForecast:
             params=dict(
                 static_cols=list(static_cols),
                 futr_exog_cols=list(self._get_needed_futr_exog()),
-                models=self.models,
-                freq=self.freq,
+                fingerprint=fingerprint,
+                payload=payload,
                 id_col=self.id_col,
                 time_col=self.time_col,
                 target_col=self.target_col,
@@ -794,13 +1757,28 @@ class NeuralForecast:
 
     def predict(
         self,
-        df: Optional[Union[DataFrame, SparkDataFrame]] = None,
-        static_df: Optional[Union[DataFrame, SparkDataFrame]] = None,
+        df: Optional[
+            Union[
+                DataFrame,
+                SparkDataFrame,
+                ArrowTable,
+                TimeSeriesArrays,
+                PolarsLazyFrame,
+                ArrowDataset,
+                str,
+            ]
+        ] = None,
+        static_df: Optional[Union[DataFrame, SparkDataFrame, ArrowTable]] = None,
         futr_df: Optional[Union[DataFrame, SparkDataFrame]] = None,
         verbose: bool = False,
         engine=None,
         level: Optional[List[Union[int, float]]] = None,
         quantiles: Optional[List[float]] = None,
+        shard_size: int = 10_000,
+        output_path: Optional[str] = None,
+        n_jobs: Optional[int] = None,
+        output: str = "frame",
+        ids: Optional[Sequence] = None,
         **data_kwargs,
     ):
         """Predict with core.NeuralForecast.
@@ -809,10 +1787,13 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas, polars or spark DataFrame, optional (default=None)
+        df : pandas, polars or spark DataFrame, pyarrow Table, TimeSeriesArrays, polars LazyFrame, pyarrow Dataset or path to a parquet dataset, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If a DataFrame is passed, it is used to generate forecasts.
-        static_df : pandas, polars or spark DataFrame, optional (default=None)
+            A pyarrow Table or a `TimeSeriesArrays` tuple must be sorted by id and time.
+            From a polars LazyFrame or a pyarrow Dataset only the columns used by the models and
+            the times within their input size of the end of each serie are read.
+        static_df : pandas, polars or spark DataFrame or pyarrow Table, optional (default=None)
             DataFrame with columns [`unique_id`] and static exogenous.
         futr_df : pandas, polars or spark DataFrame, optional (default=None)
             DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
@@ -824,6 +1805,23 @@ class NeuralForecast:
             Confidence levels between 0 and 100.
         quantiles : list of floats, optional (default=None)
             Alternative to level, target quantiles to predict.
+        shard_size : int (default=10_000)
+            Number of series predicted at once when the models were trained on local files and `df` is None,
+            or when `n_jobs` or `output_path` are set. Only the last samples of the series in a shard are read into memory.
+        output_path : str, optional (default=None)
+            Empty directory where the forecasts of each shard are saved as a parquet file, see `predict_to_parquet`.
+            If None, the forecasts of all shards are returned.
+        n_jobs : int, optional (default=None)
+            Number of processes that predict the shards of `shard_size` series, -1 uses all CPUs.
+            The processes share the weights of the models and at most two shards per process are in flight.
+            If None, the series are predicted by this process, in shards when the models were trained
+            on local files or `output_path` is set.
+        output : str (default='frame')
+            'frame' returns the forecasts in a DataFrame. 'arrays' returns a `ForecastArrays` tuple
+            with the forecasts in an array of shape (n_series, h, n_cols), without building the DataFrame.
+        ids : sequence, optional (default=None)
+            Ids of the stored series to predict, in the order of their forecasts. Only the last samples of these
+            series are taken from the stored dataset, so `df` must be None. If None, all series are predicted.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
@@ -831,51 +1829,30 @@ class NeuralForecast:
         -------
         fcsts_df : pandas or polars DataFrame
             DataFrame with insample `models` columns for point predictions and probabilistic
-            predictions for all fitted `models`.
+            predictions for all fitted `models`, a `ForecastArrays` tuple if `output='arrays'`
+            or `output_path` if it was passed.
         """
-        if df is None and not hasattr(self, "dataset"):
-            raise Exception("You must pass a DataFrame or have one stored.")
-
-        if not self._fitted:
-            raise Exception("You must fit the model before predicting.")
-
-        quantiles_ = None
-        level_ = None
-        has_level = False
-        if level is not None:
-            has_level = True
-            if quantiles is not None:
-                raise ValueError("You can't set both level and quantiles.")
-            level_ = sorted(list(set(level)))
-            quantiles_ = level_to_quantiles(level_)
-
-        if quantiles is not None:
-            if level is not None:
-                raise ValueError("You can't set both level and quantiles.")
-            quantiles_ = sorted(list(set(quantiles)))
-            level_ = quantiles_to_level(quantiles_)
+        predict_kwargs = self._check_predict_args(
+            df=df,
+            futr_df=futr_df,
+            level=level,
+            quantiles=quantiles,
+            shard_size=shard_size,
+            n_jobs=n_jobs,
+            output=output,
+            ids=ids,
+            **data_kwargs,
+        )
 
-        needed_futr_exog = self._get_needed_futr_exog()
-        if needed_futr_exog:
-            if futr_df is None:
+        # distributed df or NeuralForecast instance was trained with a distributed input and no df is provided
+        # we assume the user wants to perform distributed inference as well
+        if self._is_distributed_predict(df):
+            if output == "arrays":
                 raise ValueError(
-                    f"Models require the following future exogenous features: {needed_futr_exog}. "
-                    "Please provide them through the `futr_df` argument."
+                    "Distributed inputs can only be predicted with `output='frame'`."
                 )
-            else:
-                missing = needed_futr_exog - set(futr_df.columns)
-                if missing:
-                    raise ValueError(
-                        f"The following features are missing from `futr_df`: {missing}"
-                    )
-
-        # distributed df or NeuralForecast instance was trained with a distributed input and no df is provided
-        # we assume the user wants to perform distributed inference as well
-        is_files_dataset = isinstance(getattr(self, "dataset", None), _FilesDataset)
-        is_dataset_local_files = isinstance(
-            getattr(self, "dataset", None), LocalFilesTimeSeriesDataset
-        )
-        if isinstance(df, SparkDataFrame) or (df is None and is_files_dataset):
+            if ids is not None:
+                raise ValueError("`ids` is not supported for distributed inputs.")
             return self._predict_distributed(
                 df=df,
                 static_df=static_df,
@@ -883,14 +1860,364 @@ class NeuralForecast:
                 engine=engine,
             )
 
-        if is_dataset_local_files and df is None:
+        if output_path is not None and output == "arrays":
+            raise ValueError("`output_path` can only be used with `output='frame'`.")
+
+        nf, dataset, uids, last_dates = self._predict_dataset(
+            df, static_df, verbose, ids
+        )
+        in_shards = n_jobs is not None or output_path is not None
+        if in_shards or isinstance(dataset, LocalFilesTimeSeriesDataset):
+            shards_fcsts = nf._forecast_shards(
+                dataset=dataset,
+                uids=uids,
+                last_dates=last_dates,
+                futr_df=futr_df,
+                from_stored=df is None,
+                shard_size=shard_size,
+                n_jobs=n_jobs,
+                verbose=verbose,
+                output=output,
+                **predict_kwargs,
+            )
+            if output_path is not None:
+                return _write_forecasts(shards_fcsts, output_path)
+            fcsts = list(shards_fcsts)
+            if output == "arrays":
+                return _concat_forecast_arrays(fcsts)
+            # the shards take their ids from the same series, so they have the same categories
+            return ufp.drop_index_if_pandas(
+                ufp.vertical_concat(fcsts, match_categories=False)
+            )
+        return nf._forecast_dataset(
+            dataset=dataset,
+            uids=uids,
+            last_dates=last_dates,
+            futr_df=futr_df,
+            from_stored=df is None,
+            output=output,
+            **predict_kwargs,
+        )
+
+    def predict_iter(
+        self,
+        df: Optional[
+            Union[
+                DataFrame,
+                ArrowTable,
+                TimeSeriesArrays,
+                PolarsLazyFrame,
+                ArrowDataset,
+                str,
+            ]
+        ] = None,
+        static_df: Optional[Union[DataFrame, ArrowTable]] = None,
+        futr_df: Optional[DataFrame] = None,
+        verbose: bool = False,
+        level: Optional[List[Union[int, float]]] = None,
+        quantiles: Optional[List[float]] = None,
+        shard_size: int = 10_000,
+        n_jobs: Optional[int] = None,
+        output: str = "frame",
+        ids: Optional[Sequence] = None,
+        **data_kwargs,
+    ) -> Iterator[Union[DataFrame, ForecastArrays]]:
+        """Predict the series in shards.
+
+        Yields the forecasts of each shard of `shard_size` series as soon as they're computed,
+        so the forecasts of all series are never held in memory at once.
+        The arguments are the same as in `predict`, which accepts spark inputs as well.
+
+        Returns
+        -------
+        fcsts_dfs : iterator of pandas or polars DataFrames
+            Forecasts of each shard of series, in the order of the series.
+            `ForecastArrays` tuples if `output='arrays'`.
+        """
+        predict_kwargs = self._check_predict_args(
+            df=df,
+            futr_df=futr_df,
+            level=level,
+            quantiles=quantiles,
+            shard_size=shard_size,
+            n_jobs=n_jobs,
+            output=output,
+            ids=ids,
+            **data_kwargs,
+        )
+        if self._is_distributed_predict(df):
+            raise ValueError("Distributed inputs are predicted with `predict`.")
+        nf, dataset, uids, last_dates = self._predict_dataset(
+            df, static_df, verbose, ids
+        )
+        return nf._forecast_shards(
+            dataset=dataset,
+            uids=uids,
+            last_dates=last_dates,
+            futr_df=futr_df,
+            from_stored=df is None,
+            shard_size=shard_size,
+            n_jobs=n_jobs,
+            verbose=verbose,
+            output=output,
+            **predict_kwargs,
+        )
+
+    def predict_to_parquet(
+        self,
+        path: str,
+        df: Optional[
+            Union[
+                DataFrame,
+                ArrowTable,
+                TimeSeriesArrays,
+                PolarsLazyFrame,
+                ArrowDataset,
+                str,
+            ]
+        ] = None,
+        static_df: Optional[Union[DataFrame, ArrowTable]] = None,
+        futr_df: Optional[DataFrame] = None,
+        partition_by: Optional[List[str]] = None,
+        verbose: bool = False,
+        level: Optional[List[Union[int, float]]] = None,
+        quantiles: Optional[List[float]] = None,
+        shard_size: int = 10_000,
+        n_jobs: Optional[int] = None,
+        ids: Optional[Sequence] = None,
+        **data_kwargs,
+    ) -> str:
+        """Predict the series in shards and write their forecasts to a parquet dataset.
+
+        Each shard of `shard_size` series is written as soon as its forecasts are computed,
+        so the forecasts of all series are never held in memory at once.
+        The other arguments are the same as in `predict`.
+
+        Parameters
+        ----------
+        path : str
+            Directory of the dataset, local or in a remote filesystem supported by fsspec.
+            It must be empty or not exist.
+        partition_by : list of str, optional (default=None)
+            Columns of the forecasts used to partition the dataset, as `column=value` directories.
+            If None, the forecasts of each shard are written to a `part-{shard}.parquet` file.
+
+        Returns
+        -------
+        path : str
+            Directory of the dataset.
+        """
+        shards_fcsts = self.predict_iter(
+            df=df,
+            static_df=static_df,
+            futr_df=futr_df,
+            verbose=verbose,
+            level=level,
+            quantiles=quantiles,
+            shard_size=shard_size,
+            n_jobs=n_jobs,
+            ids=ids,
+            **data_kwargs,
+        )
+        return _write_forecasts(shards_fcsts, path, partition_by)
+
+    def predict_scenarios(
+        self,
+        futr_dfs: List[DataFrame],
+        df: Optional[
+            Union[
+                DataFrame,
+                ArrowTable,
+                TimeSeriesArrays,
+                PolarsLazyFrame,
+                ArrowDataset,
+                str,
+            ]
+        ] = None,
+        static_df: Optional[Union[DataFrame, ArrowTable]] = None,
+        verbose: bool = False,
+        level: Optional[List[Union[int, float]]] = None,
+        quantiles: Optional[List[float]] = None,
+        ids: Optional[Sequence] = None,
+        shard_size: int = 10_000,
+        **data_kwargs,
+    ) -> DataFrame:
+        """Predict the series under alternative futures of their exogenous features.
+
+        The history of the series is processed once and its last samples are repeated for each scenario,
+        so the models forecast several scenarios in the same batches instead of once per scenario.
+        The models still encode the history of each scenario, the speedup comes from the batching.
+        Models that forecast all series jointly predict one scenario at a time.
+        The other arguments are the same as in `predict`.
+
+        Parameters
+        ----------
+        futr_dfs : list of pandas or polars DataFrames
+            Future exogenous of each scenario, as the `futr_df` of `predict`.
+        shard_size : int (default=10_000)
+            Number of series predicted at once, counting each serie once per scenario.
+            The scenarios are stacked until they reach it, the series of a scenario are always predicted together.
+
+        Returns
+        -------
+        fcsts_df : pandas or polars DataFrame
+            Forecasts of all scenarios, with a `scenario` column with the position of their frame in `futr_dfs`.
+        """
+        if not futr_dfs:
+            raise ValueError("`futr_dfs` must contain at least one frame.")
+        predict_kwargs = self._check_predict_args(
+            df=df,
+            futr_df=futr_dfs[0],
+            level=level,
+            quantiles=quantiles,
+            shard_size=shard_size,
+            ids=ids,
+            **data_kwargs,
+        )
+        for futr_df in futr_dfs[1:]:
+            self._check_futr_df(futr_df)
+        if self._is_distributed_predict(df):
+            raise ValueError("Distributed inputs are predicted with `predict`.")
+        nf, dataset, uids, last_dates = self._predict_dataset(
+            df, static_df, verbose, ids
+        )
+
+        # the samples used by the models are taken once and shared by the scenarios
+        lookback = self._predict_lookback()
+        if isinstance(dataset, LocalFilesTimeSeriesDataset):
+            dataset = dataset.read_tails(np.arange(len(dataset)), lookback)
+        elif df is None and ids is None and lookback is not None:
+            dataset = dataset.take(np.arange(len(dataset)), lookback)
+
+        # the scenarios are stacked as more series up to the shard size,
+        # except for models that see all series at once
+        n_series = len(uids)
+        if any(model.MULTIVARIATE for model in self.models):
+            n_stacked = 1
+        else:
+            n_stacked = max(shard_size // n_series, 1)
+        fcsts_dfs = []
+        for start in range(0, len(futr_dfs), n_stacked):
+            # the inputs of the scenarios are only built for the stacked ones
+            stacked = [
+                nf._forecast_inputs(
+                    dataset=dataset,
+                    uids=uids,
+                    last_dates=last_dates,
+                    futr_df=futr_df,
+                    from_stored=df is None,
+                )
+                for futr_df in futr_dfs[start : start + n_stacked]
+            ]
+            idxs = np.tile(np.arange(n_series), len(stacked))
+            fcsts, cols = nf._for_shard(idxs)._forecast_values(
+                TimeSeriesDataset.concat(
+                    [scenario_dataset for _, scenario_dataset in stacked]
+                ),
+                ufp.take_rows(uids, idxs),
+                **predict_kwargs,
+            )
+            for i, (fcsts_df, _) in enumerate(stacked):
+                scenario_fcsts = fcsts[
+                    i * n_series * self.h : (i + 1) * n_series * self.h
+                ]
+                fcsts_df = nf._forecasts_output(
+                    fcsts_df, scenario_fcsts, cols, uids, last_dates, "frame"
+                )
+                fcsts_df = ufp.assign_columns(fcsts_df, "scenario", start + i)
+                fcsts_dfs.append(fcsts_df[["scenario", *fcsts_df.columns[:-1]]])
+        # the scenarios take their ids from the same series, so they have the same categories
+        return ufp.drop_index_if_pandas(
+            ufp.vertical_concat(fcsts_dfs, match_categories=False)
+        )
+
+    def _check_predict_args(
+        self,
+        df,
+        futr_df,
+        level,
+        quantiles,
+        shard_size=10_000,
+        n_jobs=None,
+        output="frame",
+        ids=None,
+        **data_kwargs,
+    ):
+        # validates the arguments of predict, returns the arguments to compute the forecasts
+        if df is None and not hasattr(self, "dataset"):
+            raise Exception("You must pass a DataFrame or have one stored.")
+
+        if not self._fitted:
+            raise Exception("You must fit the model before predicting.")
+
+        if n_jobs is not None and (n_jobs == 0 or n_jobs < -1):
+            raise ValueError(
+                f"`n_jobs` must be a positive integer or -1, got: {n_jobs}"
+            )
+
+        if shard_size < 1:
             raise ValueError(
-                "When the model has been trained on a dataset that is split between multiple files, you must pass in a specific dataframe for prediciton."
+                f"shard_size must be a positive integer, got: {shard_size}"
             )
 
+        if output not in ("frame", "arrays"):
+            raise ValueError(
+                f"`output` must be either 'frame' or 'arrays', got: {output}"
+            )
+
+        if ids is not None and df is not None:
+            raise ValueError(
+                "`ids` selects series of the stored dataset, filter `df` instead."
+            )
+
+        quantiles_ = None
+        level_ = None
+        has_level = False
+        if level is not None:
+            has_level = True
+            if quantiles is not None:
+                raise ValueError("You can't set both level and quantiles.")
+            level_ = sorted(list(set(level)))
+            quantiles_ = level_to_quantiles(level_)
+
+        if quantiles is not None:
+            if level is not None:
+                raise ValueError("You can't set both level and quantiles.")
+            quantiles_ = sorted(list(set(quantiles)))
+            level_ = quantiles_to_level(quantiles_)
+
+        self._check_futr_df(futr_df)
+        return dict(
+            quantiles_=quantiles_, level_=level_, has_level=has_level, **data_kwargs
+        )
+
+    def _check_futr_df(self, futr_df) -> None:
+        needed_futr_exog = self._get_needed_futr_exog()
+        if needed_futr_exog:
+            if futr_df is None:
+                raise ValueError(
+                    f"Models require the following future exogenous features: {needed_futr_exog}. "
+                    "Please provide them through the `futr_df` argument."
+                )
+            else:
+                missing = needed_futr_exog - set(futr_df.columns)
+                if missing:
+                    raise ValueError(
+                        f"The following features are missing from `futr_df`: {missing}"
+                    )
+
+    def _is_distributed_predict(self, df) -> bool:
+        is_files_dataset = isinstance(getattr(self, "dataset", None), _FilesDataset)
+        return isinstance(df, SparkDataFrame) or (df is None and is_files_dataset)
+
+    def _predict_dataset(self, df, static_df, verbose, ids=None):
+        # models, dataset, ids and last dates of the series to predict
         # Process new dataset but does not store it.
         if df is not None:
-            validate_freq(df[self.time_col], self.freq)
+            # the models only see the last samples of each serie
+            lookback = self._predict_lookback()
+            if lookback is not None and isinstance(df, (pd.DataFrame, pl_DataFrame)):
+                df = _series_tails(df, lookback, self.id_col, self.time_col)
             dataset, uids, last_dates, _ = self._prepare_fit(
                 df=df,
                 static_df=static_df,
@@ -898,56 +2225,270 @@ class NeuralForecast:
                 id_col=self.id_col,
                 time_col=self.time_col,
                 target_col=self.target_col,
+                lookback=lookback,
             )
+            if verbose:
+                self._print_preprocessing_times()
         else:
             dataset = self.dataset
             uids = self.uids
             last_dates = self.last_dates
             if verbose:
                 print("Using stored dataset.")
+            if ids is not None:
+                return self._take_series(dataset, uids, last_dates, ids)
+        return self, dataset, uids, last_dates
+
+    def _take_series(self, dataset, uids, last_dates, ids):
+        # only the samples that the models use are taken from the series in ids
+        ids = np.asarray(ids)
+        idxs = pd.Index(np.asarray(uids)).get_indexer(ids)
+        if not idxs.size:
+            raise ValueError("`ids` must contain at least one id.")
+        if (idxs < 0).any():
+            missing = ids[idxs < 0][:5].tolist()
+            raise ValueError(
+                f"Found ids that are not in the stored dataset, e.g. {missing}"
+            )
+        if isinstance(dataset, LocalFilesTimeSeriesDataset):
+            dataset = dataset.read_tails(idxs, self._predict_lookback())
+        else:
+            dataset = dataset.take(idxs, self._predict_lookback())
+        uids = ufp.take_rows(uids, idxs)
+        if isinstance(uids, pd.Series):
+            uids = uids.reset_index(drop=True)
+        return self._for_shard(idxs), dataset, uids, last_dates[idxs]
 
-        # Placeholder dataframe for predictions with unique_id and ds
-        fcsts_df = ufp.make_future_dataframe(
+    def _forecast_shards(
+        self,
+        dataset,
+        uids,
+        last_dates,
+        futr_df,
+        from_stored,
+        shard_size,
+        n_jobs,
+        verbose,
+        output,
+        **predict_kwargs,
+    ):
+        # forecasts of each shard, in order. The shards only get the samples that the models use
+        n_series = len(dataset)
+        bounds = _shard_bounds(n_series, shard_size)
+        shards = self._shards_inputs(
+            dataset=dataset,
             uids=uids,
-            last_times=last_dates,
+            last_dates=last_dates,
+            futr_dfs=_split_futr_df(futr_df, uids, bounds, self.id_col),
+            from_stored=from_stored,
+            bounds=bounds,
+        )
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        n_jobs = min(n_jobs or 1, len(bounds))
+        if n_jobs == 1:
+            for (_, stop), (
+                shard_nf,
+                shard_uids,
+                shard_last_dates,
+                fcsts_df,
+                shard_dataset,
+            ) in zip(bounds, shards):
+                fcsts, cols = shard_nf._forecast_values(
+                    shard_dataset, shard_uids, **predict_kwargs
+                )
+                if verbose:
+                    print(f"Predicted {stop:,} of {n_series:,} series.")
+                yield self._forecasts_output(
+                    fcsts_df, fcsts, cols, shard_uids, shard_last_dates, output
+                )
+            return
+
+        # the processes only run the models, the frames are built here. polars can't be used
+        # in a forked process once its thread pool has started, so the processes never see its frames.
+        # The processes get copies of the models once, with their weights moved to shared memory.
+        nf = copy(self)
+        nf.models = [deepcopy(model) for model in self.models]
+        for model in nf.models:
+            model.share_memory()
+        for attr in ("dataset", "uids", "last_dates", "ds", "_cs_df"):
+            nf.__dict__.pop(attr, None)
+        nf._preprocessing_cache = None
+        num_threads = max((os.cpu_count() or 1) // n_jobs, 1)
+        items = (
+            (
+                (shard_uids, shard_last_dates, fcsts_df),
+                (
+                    shard_dataset,
+                    np.asarray(shard_uids),
+                    shard_nf.scalers_,
+                    _to_pandas(getattr(shard_nf, "_cs_df", None)),
+                    predict_kwargs,
+                ),
+            )
+            for shard_nf, shard_uids, shard_last_dates, fcsts_df, shard_dataset in shards
+        )
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_predict_worker,
+            initargs=(nf, num_threads),
+        ) as executor:
+            # at most two shards per process are in flight
+            results = _imap_bounded(
+                executor, _predict_shard_worker, items, max_in_flight=2 * n_jobs
+            )
+            for (_, stop), (
+                (shard_uids, shard_last_dates, fcsts_df),
+                (fcsts, cols),
+            ) in zip(bounds, results):
+                if verbose:
+                    print(f"Predicted {stop:,} of {n_series:,} series.")
+                yield self._forecasts_output(
+                    fcsts_df, fcsts, cols, shard_uids, shard_last_dates, output
+                )
+
+    def _shards_inputs(self, dataset, uids, last_dates, futr_dfs, from_stored, bounds):
+        # models, ids, last dates, placeholder frame and dataset with the future values of each shard
+        for (start, stop), futr_df in zip(bounds, futr_dfs):
+            idxs = np.arange(start, stop)
+            if isinstance(dataset, LocalFilesTimeSeriesDataset):
+                shard_dataset = dataset.read_tails(idxs, self._predict_lookback())
+            else:
+                shard_dataset = dataset.take_range(start, stop)
+            shard_uids = ufp.take_rows(uids, idxs)
+            if isinstance(shard_uids, pd.Series):
+                shard_uids = shard_uids.reset_index(drop=True)
+            shard_last_dates = last_dates[idxs]
+            shard_nf = self._for_shard(idxs)
+            fcsts_df, shard_dataset = shard_nf._forecast_inputs(
+                dataset=shard_dataset,
+                uids=shard_uids,
+                last_dates=shard_last_dates,
+                futr_df=futr_df,
+                from_stored=from_stored,
+            )
+            yield shard_nf, shard_uids, shard_last_dates, fcsts_df, shard_dataset
+
+    def _for_shard(self, idxs: np.ndarray) -> "NeuralForecast":
+        # shallow copy with the local statistics and conformity scores of the series in idxs
+        nf = copy(self)
+        nf.scalers_ = _take_scalers(self.scalers_, idxs)
+        cs_df = getattr(self, "_cs_df", None)
+        if cs_df is not None:
+            # the scores are computed together with the intervals configuration
+            assert self.prediction_intervals is not None
+            # the scores are sorted by serie, window and step
+            n_scores = self.prediction_intervals.n_windows * self.h
+            rows = (idxs[:, None] * n_scores + np.arange(n_scores)).ravel()
+            nf._cs_df = ufp.take_rows(cs_df, rows)
+        return nf
+
+    def _forecast_dataset(
+        self,
+        dataset,
+        uids,
+        last_dates,
+        futr_df,
+        from_stored,
+        output,
+        quantiles_,
+        level_,
+        has_level,
+        **data_kwargs,
+    ):
+        fcsts_df, dataset = self._forecast_inputs(
+            dataset=dataset,
+            uids=uids,
+            last_dates=last_dates,
+            futr_df=futr_df,
+            from_stored=from_stored,
+        )
+        fcsts, cols = self._forecast_values(
+            dataset,
+            uids,
+            quantiles_=quantiles_,
+            level_=level_,
+            has_level=has_level,
+            **data_kwargs,
+        )
+        return self._forecasts_output(fcsts_df, fcsts, cols, uids, last_dates, output)
+
+    def _forecast_inputs(self, dataset, uids, last_dates, futr_df, from_stored):
+        # without future exogenous the future samples are missing, so their frame isn't needed
+        if futr_df is None:
+            futr_dataset = dataset.empty_future(self.h)
+            self._scalers_transform(futr_dataset)
+            return None, dataset.append(futr_dataset)
+
+        # the rows of futr_df are mapped to the future samples of their series with their times,
+        # only the frequencies that depend on the dates need a placeholder frame to be joined
+        fcsts_df = None
+        slots = _future_slots(
+            futr_df,
+            uids=uids,
+            last_dates=last_dates,
             freq=self.freq,
             h=self.h,
             id_col=self.id_col,
             time_col=self.time_col,
         )
+        if slots is None:
+            # Placeholder dataframe for predictions with unique_id and ds
+            fcsts_df = ufp.make_future_dataframe(
+                uids=uids,
+                last_times=last_dates,
+                freq=self.freq,
+                h=self.h,
+                id_col=self.id_col,
+                time_col=self.time_col,
+            )
+            futr_orig_rows = futr_df.shape[0]
+            futr_df = ufp.join(futr_df, fcsts_df, on=[self.id_col, self.time_col])
+            n_missing = fcsts_df.shape[0] - futr_df.shape[0]
+            n_unused = futr_orig_rows - futr_df.shape[0]
+            used = np.ones(futr_df.shape[0], dtype=bool)
+        else:
+            used = slots >= 0
+            filled = np.zeros(len(uids) * self.h, dtype=bool)
+            filled[slots[used]] = True
+            n_missing = (~filled).sum()
+            n_unused = (~used).sum()
 
         # Update and define new forecasting dataset
-        if futr_df is None:
-            futr_df = fcsts_df
+        if n_missing > 0:
+            if from_stored:
+                expected_cmd = "make_future_dataframe()"
+                missing_cmd = "get_missing_future(futr_df)"
+            else:
+                expected_cmd = "make_future_dataframe(df)"
+                missing_cmd = "get_missing_future(futr_df, df)"
+            raise ValueError(
+                "There are missing combinations of ids and times in `futr_df`.\n"
+                f"You can run the `{expected_cmd}` method to get the expected combinations or "
+                f"the `{missing_cmd}` method to get the missing combinations."
+            )
+        if n_unused > 0:
+            warnings.warn(f"Dropped {n_unused:,} unused rows from `futr_df`.")
+        if any(
+            np.asarray(ufp.is_none(futr_df[col]))[used].any()
+            for col in self._get_needed_futr_exog()
+        ):
+            raise ValueError("Found null values in `futr_df`")
+        if slots is None:
+            futr_dataset = dataset.align(
+                futr_df,
+                id_col=self.id_col,
+                time_col=self.time_col,
+                target_col=self.target_col,
+            )
         else:
-            futr_orig_rows = futr_df.shape[0]
-            futr_df = ufp.join(futr_df, fcsts_df, on=[self.id_col, self.time_col])
-            if futr_df.shape[0] < fcsts_df.shape[0]:
-                if df is None:
-                    expected_cmd = "make_future_dataframe()"
-                    missing_cmd = "get_missing_future(futr_df)"
-                else:
-                    expected_cmd = "make_future_dataframe(df)"
-                    missing_cmd = "get_missing_future(futr_df, df)"
-                raise ValueError(
-                    "There are missing combinations of ids and times in `futr_df`.\n"
-                    f"You can run the `{expected_cmd}` method to get the expected combinations or "
-                    f"the `{missing_cmd}` method to get the missing combinations."
-                )
-            if futr_orig_rows > futr_df.shape[0]:
-                dropped_rows = futr_orig_rows - futr_df.shape[0]
-                warnings.warn(f"Dropped {dropped_rows:,} unused rows from `futr_df`.")
-            if any(ufp.is_none(futr_df[col]).any() for col in needed_futr_exog):
-                raise ValueError("Found null values in `futr_df`")
-        futr_dataset = dataset.align(
-            futr_df,
-            id_col=self.id_col,
-            time_col=self.time_col,
-            target_col=self.target_col,
-        )
+            futr_dataset = dataset.align_slots(futr_df, slots, self.h)
         self._scalers_transform(futr_dataset)
-        dataset = dataset.append(futr_dataset)
+        return fcsts_df, dataset.append(futr_dataset)
 
+    def _forecast_values(
+        self, dataset, uids, quantiles_, level_, has_level, **data_kwargs
+    ):
         fcsts, cols = self._generate_forecasts(
             dataset=dataset,
             uids=uids,
@@ -960,21 +2501,118 @@ class NeuralForecast:
         if self.scalers_:
             indptr = np.append(0, np.full(len(uids), self.h).cumsum())
             fcsts = self._scalers_target_inverse_transform(fcsts, indptr)
+        return fcsts, cols
 
-        # Declare predictions pd.DataFrame
-        if isinstance(fcsts_df, pl_DataFrame):
-            fcsts = pl_DataFrame(dict(zip(cols, fcsts.T)))
-        else:
-            fcsts = pd.DataFrame(fcsts, columns=cols)
-        fcsts_df = ufp.horizontal_concat([fcsts_df, fcsts])
-
-        return fcsts_df
+    def _forecasts_output(self, fcsts_df, fcsts, cols, uids, last_dates, output):
+        # the placeholder frame is only built for the future exogenous
+        arrays = ForecastArrays(
+            forecasts=fcsts.reshape(len(uids), self.h, len(cols)),
+            columns=cols,
+            uids=uids,
+            last_dates=last_dates,
+            freq=self.freq,
+            id_col=self.id_col,
+            time_col=self.time_col,
+        )
+        if output == "arrays":
+            return arrays
+        if fcsts_df is None:
+            return arrays.to_frame()
+        return _forecasts_frame(fcsts_df, fcsts, cols)
+
+    def _predict_lookback(self) -> Optional[int]:
+        # number of past samples of each serie used by the models to predict, None if unknown
+        lookbacks = []
+        for model in self.models:
+            if isinstance(model, BaseAuto):
+                model = model.model
+            if getattr(model, "RECURRENT", False):
+                lookbacks.append(model.inference_input_size)
+            elif hasattr(model, "input_size"):
+                lookbacks.append(model.input_size)
+            else:
+                return None
+        return max(lookbacks)
 
     def _reset_models(self):
         self.models = [deepcopy(model) for model in self.models_init]
         if self._fitted:
             print("WARNING: Deleting previously fitted models.")
 
+    def _backtest_views(
+        self,
+        df: DataFrame,
+        static_df: Optional[DataFrame],
+        n_windows: int,
+        step_size: int,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+    ):
+        # ingest the data once and represent the train set of each window as a
+        # truncated view of the same dataset. Returns None if some series are too
+        # short for a window, in which case the splits are built from the dataframe.
+        df = ufp.sort(df, by=[id_col, time_col])
+        self.id_col = id_col
+        self.time_col = time_col
+        self.target_col = target_col
+        dataset, uids, last_dates, ds = TimeSeriesDataset.from_df(
+            df=df,
+            static_df=static_df,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+        )
+        self._check_nan(dataset, df, static_df)
+        test_size = self.h + step_size * (n_windows - 1)
+        splits = []
+        for i_window in range(n_windows):
+            offset = test_size - i_window * step_size
+            train_ends = ufp.offset_times(last_dates, self.freq, -offset)
+            valid_ends = ufp.offset_times(train_ends, self.freq, self.h)
+            train_sizes, valid_sizes = _window_sizes(
+                times=ds,
+                indptr=dataset.indptr,
+                train_ends=np.asarray(train_ends),
+                valid_ends=np.asarray(valid_ends),
+            )
+            if (train_sizes == 0).any():
+                return None
+            valid_indptr = np.append(0, valid_sizes.cumsum())
+            valid_idxs = np.repeat(
+                dataset.indptr[:-1] + train_sizes - valid_indptr[:-1], valid_sizes
+            ) + np.arange(valid_indptr[-1])
+            if isinstance(df, pd.DataFrame):
+                cutoffs = pd.DataFrame(
+                    {
+                        id_col: uids.reset_index(drop=True),
+                        "cutoff": pd.Series(train_ends).reset_index(drop=True),
+                    }
+                )
+            else:
+                cutoffs = pl_DataFrame({id_col: uids, "cutoff": train_ends})
+            test = ufp.take_rows(df, valid_idxs)
+            splits.append((cutoffs, dataset.truncate(train_sizes), test))
+        return uids, ds, splits
+
+    def _set_window_dataset(
+        self, view, uids: Series, ds: np.ndarray, fit_scalers: bool
+    ) -> None:
+        # local scalers can't modify the shared buffer, so they work on a copy of the window
+        dataset = view if self.local_scaler_type is None else view.materialize()
+        if fit_scalers:
+            self._scalers_fit_transform(dataset)
+        else:
+            self._scalers_transform(dataset)
+        last_dates = ds[view.starts + view.sizes - 1]
+        if isinstance(uids, pl_Series):
+            last_dates = pl_Series(self.time_col, last_dates)
+        else:
+            last_dates = pd.Index(last_dates, name=self.time_col)
+        self.dataset = dataset
+        self.uids = uids
+        self.last_dates = last_dates
+
     def _no_refit_cross_validation(
         self,
         df: Optional[DataFrame],
@@ -987,14 +2625,15 @@ class NeuralForecast:
         id_col: str,
         time_col: str,
         target_col: str,
+        target_df: Optional[DataFrame] = None,
         **data_kwargs,
     ) -> DataFrame:
         if (df is None) and not (hasattr(self, "dataset")):
             raise Exception("You must pass a DataFrame or have one stored.")
 
         # Process and save new dataset (in self)
+        # the dataset of a lazy input is already prepared and its target passed in `target_df`
         if df is not None:
-            validate_freq(df[time_col], self.freq)
             self.dataset, self.uids, self.last_dates, self.ds = self._prepare_fit(
                 df=df,
                 static_df=static_df,
@@ -1003,9 +2642,8 @@ class NeuralForecast:
                 time_col=time_col,
                 target_col=target_col,
             )
-        else:
-            if verbose:
-                print("Using stored dataset.")
+        elif verbose and target_df is None:
+            print("Using stored dataset.")
 
         if val_size is not None:
             if self.dataset.min_size < (val_size + test_size):
@@ -1077,16 +2715,272 @@ class NeuralForecast:
         fcsts_df = ufp.horizontal_concat([fcsts_df, fcsts])
 
         # Add original input df's y to forecasts DataFrame
+        y_df = df if target_df is None else target_df
         return ufp.join(
             fcsts_df,
-            df[[id_col, time_col, target_col]],
+            y_df[[id_col, time_col, target_col]],
             how="left",
             on=[id_col, time_col],
         )
 
+    def _streaming_cross_validation(
+        self,
+        df: Optional[DataFrame],
+        static_df: Optional[DataFrame],
+        n_windows: int,
+        step_size: int,
+        val_size: Optional[int],
+        test_size: int,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        metrics: List[Callable],
+        spill_path: Optional[str],
+        chunk_size: int,
+        target_df: Optional[DataFrame] = None,
+        **data_kwargs,
+    ) -> DataFrame:
+        # the dataset of a lazy input is already prepared and its target passed in `target_df`
+        if target_df is None:
+            if df is None:
+                raise ValueError("Must specify `df` with `metrics`.")
+            self.dataset, self.uids, self.last_dates, self.ds = self._prepare_fit(
+                df=df,
+                static_df=static_df,
+                predict_only=False,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+            target_df = df
+        if val_size is not None:
+            if self.dataset.min_size < (val_size + test_size):
+                warnings.warn(
+                    "Validation and test sets are larger than the shorter time-series."
+                )
+
+        # original target, in the order of the dataset
+        y = target_df[target_col].to_numpy()
+        sort_idxs = ufp.maybe_compute_sort_indices(target_df, id_col, time_col)
+        if sort_idxs is not None:
+            y = y[sort_idxs]
+
+        models = []
+        for model in self.models:
+            if self._add_level and (
+                model.loss.outputsize_multiplier > 1 or isinstance(model.loss, IQLoss)
+            ):
+                continue
+            model.fit(dataset=self.dataset, val_size=val_size, test_size=test_size)
+            models.append(model)
+        self._fitted = True
+        cols = self._get_model_names(add_level=self._add_level)
+        if isinstance(self.uids, pl_Series):
+            df_constructor = pl_DataFrame
+        else:
+            df_constructor = pd.DataFrame
+        if spill_path is not None:
+            fs, _, _ = fsspec.get_fs_token_paths(spill_path)
+            fs.makedirs(spill_path, exist_ok=True)
+
+        n_series = self.dataset.n_groups
+        sizes = np.diff(self.dataset.indptr)
+        metrics_dfs: List[DataFrame] = []
+        for i_chunk, first_window in enumerate(range(0, n_windows, chunk_size)):
+            last_window = min(first_window + chunk_size, n_windows)
+            n_chunk_windows = last_window - first_window
+            # the windows after the chunk are removed by truncating the series
+            # and the ones before it by the test size of the models
+            later_size = step_size * (n_windows - last_window)
+            chunk_dataset = self.dataset.truncate(np.maximum(sizes - later_size, 1))
+            chunk_test_size = self.h + step_size * (n_chunk_windows - 1)
+            fcsts_list = []
+            for model in models:
+                model.set_test_size(test_size=chunk_test_size)
+                fcsts_list.append(
+                    model.predict(chunk_dataset, step_size=step_size, **data_kwargs)
+                )
+                model.set_test_size(test_size=test_size)
+            fcsts = np.concatenate(fcsts_list, axis=-1)
+            if self.scalers_:
+                indptr = np.arange(
+                    0,
+                    n_chunk_windows * self.h * (n_series + 1),
+                    n_chunk_windows * self.h,
+                    dtype=np.int32,
+                )
+                fcsts = self._scalers_target_inverse_transform(fcsts, indptr)
+
+            # same as ufp.cv_times, a serie is used in a window if it has at least one train sample
+            offsets = test_size - step_size * np.arange(first_window, last_window) + 1
+            use_windows = sizes[:, None] >= offsets
+            cutoff_idxs = (self.dataset.indptr[1:, None] - offsets)[use_windows]
+            valid_idxs = np.repeat(cutoff_idxs + 1, self.h) + np.tile(
+                np.arange(self.h), cutoff_idxs.size
+            )
+            fcsts = fcsts.reshape(n_series, n_chunk_windows, self.h, -1)[use_windows]
+            windows_y = y[valid_idxs].reshape(-1, self.h)
+            windows_per_serie = use_windows.sum(axis=1)
+
+            metrics_values = _windows_metrics(windows_y, fcsts, cols, metrics)
+            windows_uids = ufp.repeat(self.uids, windows_per_serie)
+            for name, values in metrics_values.items():
+                metrics_dfs.append(
+                    df_constructor(
+                        {
+                            id_col: windows_uids,
+                            "cutoff": self.ds[cutoff_idxs],
+                            "metric": [name] * len(cutoff_idxs),
+                            **dict(zip(cols, values.T)),
+                        }
+                    )
+                )
+            if spill_path is not None:
+                fcsts_df = df_constructor(
+                    {
+                        id_col: ufp.repeat(self.uids, windows_per_serie * self.h),
+                        time_col: self.ds[valid_idxs],
+                        "cutoff": np.repeat(self.ds[cutoff_idxs], self.h),
+                        **dict(zip(cols, fcsts.reshape(-1, len(cols)).T)),
+                        target_col: windows_y.ravel(),
+                    }
+                )
+                with fsspec.open(f"{spill_path}/part-{i_chunk}.parquet", "wb") as f:
+                    if isinstance(fcsts_df, pd.DataFrame):
+                        fcsts_df.to_parquet(f, index=False)
+                    else:
+                        fcsts_df.write_parquet(f)
+        metrics_df = ufp.vertical_concat(metrics_dfs, match_categories=False)
+        metrics_df = ufp.drop_index_if_pandas(metrics_df)
+        return ufp.sort(metrics_df, by=[id_col, "cutoff", "metric"])
+
+    def _refit_windows(
+        self,
+        splits,
+        uids: Optional[Series],
+        ds: Optional[np.ndarray],
+        refit: Union[bool, int],
+        static_df: Optional[DataFrame],
+        val_size: Optional[int],
+        verbose: bool,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        prediction_intervals: Optional[PredictionIntervals],
+        level: Optional[List[Union[int, float]]],
+        quantiles: Optional[List[float]],
+        data_kwargs: Dict[str, Any],
+    ) -> List[DataFrame]:
+        # the splits are dataset views when uids and ds are provided, dataframes otherwise
+        results = []
+        for i_window, (cutoffs, train, test) in enumerate(splits):
+            should_fit = i_window == 0 or (refit > 0 and i_window % refit == 0)
+            if ds is not None:
+                # the window's train set is stored as the dataset
+                self._set_window_dataset(
+                    train, uids=uids, ds=ds, fit_scalers=should_fit
+                )
+                fit_df = None
+                predict_df: Optional[DataFrame] = None
+            else:
+                fit_df = train
+                predict_df = None if should_fit else train
+            if should_fit:
+                self.fit(
+                    df=fit_df,
+                    static_df=static_df,
+                    val_size=val_size,
+                    use_init_models=False,
+                    verbose=verbose,
+                    id_col=id_col,
+                    time_col=time_col,
+                    target_col=target_col,
+                    prediction_intervals=prediction_intervals,
+                )
+                if ds is not None:
+                    fitted_window = (train, self.dataset, self.last_dates)
+            needed_futr_exog = self._get_needed_futr_exog()
+            if needed_futr_exog:
+                futr_df: Optional[DataFrame] = test
+            else:
+                futr_df = None
+            preds = self.predict(
+                df=predict_df,
+                static_df=static_df,
+                futr_df=futr_df,
+                verbose=verbose,
+                level=level,
+                quantiles=quantiles,
+                **data_kwargs,
+            )
+            preds = ufp.join(preds, cutoffs, on=id_col, how="left")
+            fold_result = ufp.join(
+                preds, test[[id_col, time_col, target_col]], on=[id_col, time_col]
+            )
+            results.append(fold_result)
+        if ds is not None:
+            # keep the last fitted train set stored, as a regular dataset
+            view, dataset, self.last_dates = fitted_window
+            if isinstance(dataset, _TimeSeriesDatasetView):
+                dataset = dataset.materialize()
+            self.dataset = dataset
+            self.uids = uids
+            self.ds = self._maybe_compact_times(ds[view.take_idxs()], view.indptr)
+        return results
+
+    def _parallel_refit_windows(
+        self,
+        splits,
+        n_jobs: int,
+        **kwargs,
+    ) -> List[DataFrame]:
+        # every group of windows that starts with a refit is independent of the others,
+        # so they're trained from copies of the current models and run in separate processes
+        refit_every = int(kwargs["refit"])
+        groups = [
+            splits[i : i + refit_every] for i in range(0, len(splits), refit_every)
+        ]
+        # the stored datasets are replaced by the windows, no need to send them
+        stored_attrs = ("dataset", "uids", "last_dates", "ds")
+        nf = copy(self)
+        for attr in stored_attrs:
+            nf.__dict__.pop(attr, None)
+        # only the copies sent to the workers drop the cache, the instance keeps it
+        nf._preprocessing_cache = None
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        n_jobs = min(n_jobs, len(groups))
+        if n_jobs == 1:
+            outputs = [
+                _refit_windows_worker(nf, group, None, i == len(groups) - 1, kwargs)
+                for i, group in enumerate(groups)
+            ]
+        else:
+            num_threads = max((os.cpu_count() or 1) // n_jobs, 1)
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [
+                    executor.submit(
+                        _refit_windows_worker,
+                        nf,
+                        group,
+                        num_threads,
+                        i == len(groups) - 1,
+                        kwargs,
+                    )
+                    for i, group in enumerate(groups)
+                ]
+                outputs = [future.result() for future in futures]
+        # only the attributes replaced by the windows are taken from the last one,
+        # so the instance ends in the same state as in the sequential case
+        last_nf = outputs[-1][1]
+        for attr in _REFIT_ATTRS:
+            if attr in last_nf.__dict__:
+                setattr(self, attr, getattr(last_nf, attr))
+        return [fold for group_results, _ in outputs for fold in group_results]
+
     def cross_validation(
         self,
-        df: Optional[DataFrame] = None,
+        df: Optional[Union[DataFrame, PolarsLazyFrame, ArrowDataset, str]] = None,
         static_df: Optional[DataFrame] = None,
         n_windows: int = 1,
         step_size: int = 1,
@@ -1101,6 +2995,12 @@ class NeuralForecast:
         prediction_intervals: Optional[PredictionIntervals] = None,
         level: Optional[List[Union[int, float]]] = None,
         quantiles: Optional[List[float]] = None,
+        refit_strategy: str = "full",
+        refit_steps: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+        metrics: Optional[List[Callable]] = None,
+        spill_path: Optional[str] = None,
+        chunk_size: int = 10,
         **data_kwargs,
     ) -> DataFrame:
         """Temporal Cross-Validation with core.NeuralForecast.
@@ -1110,8 +3010,11 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas or polars DataFrame, optional (default=None)
+        df : pandas or polars DataFrame, polars LazyFrame, pyarrow Dataset or path to a parquet dataset, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
+            Only the columns used by the models are loaded from a polars LazyFrame or a pyarrow Dataset.
+            Without `refit`, the dataset is built from the record batches of a pyarrow Dataset
+            and only the ids, times and target are kept as a frame, with `refit` the windows are taken from a frame.
             If None, a previously stored dataset is required.
         static_df : pandas or polars DataFrame, optional (default=None)
             DataFrame with columns [`unique_id`] and static exogenous.
@@ -1143,6 +3046,28 @@ class NeuralForecast:
             Confidence levels between 0 and 100.
         quantiles : list of floats, optional (default=None)
             Alternative to level, target quantiles to predict.
+        refit_strategy : str (default='full')
+            How the models are retrained when `refit` is not False.
+            If 'full', every refit trains the models for their full `max_steps`.
+            If 'warm_start', the first window trains for `max_steps` and every following refit
+            resumes from the previous weights and optimizer state for `refit_steps` steps.
+            Auto models are always retrained with 'full'.
+        refit_steps : int, optional (default=None)
+            Number of training steps of each warm started refit. Required when `refit_strategy='warm_start'`.
+        n_jobs : int, optional (default=None)
+            Number of processes used to train the refit windows in parallel, -1 uses all cores.
+            If None, the windows are trained sequentially and each refit starts from the previous weights.
+            Only supported when every model is an auto model, since they're tuned and trained from scratch
+            on each refit, so the windows are independent and the results match the sequential ones.
+        metrics : list of callables, optional (default=None)
+            Metrics from `neuralforecast.losses.numpy` (or with the same signature) to evaluate on each window.
+            If passed, the forecasts are computed in chunks of windows and consumed as they're produced,
+            and a DataFrame with the value of each metric by serie, cutoff and model output is returned.
+            `quantile_loss` is only evaluated on the quantile outputs. Only supported with `refit=False`.
+        spill_path : str, optional (default=None)
+            Directory where the forecasts of each chunk are saved as a parquet file, when `metrics` is passed.
+        chunk_size : int (default=10)
+            Number of windows predicted at once when `metrics` is passed.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
@@ -1150,7 +3075,7 @@ class NeuralForecast:
         -------
         fcsts_df : pandas or polars DataFrame
             DataFrame with insample `models` columns for point predictions and probabilistic
-            predictions for all fitted `models`.
+            predictions for all fitted `models`, or with the metrics of each window if `metrics` is passed.
         """
         h = self.h
         if n_windows is None and test_size is None:
@@ -1182,10 +3107,91 @@ class NeuralForecast:
         if level is not None and quantiles is not None:
             raise ValueError("You can't set both level and quantiles argument.")
 
+        if refit_strategy not in ("full", "warm_start"):
+            raise ValueError(
+                f"refit_strategy must be one of ['full', 'warm_start'], got: {refit_strategy}"
+            )
+        if refit_strategy == "warm_start" and (refit_steps is None or refit_steps < 1):
+            raise ValueError(
+                "`refit_steps` must be a positive integer when `refit_strategy='warm_start'`."
+            )
+        if n_jobs is not None:
+            if not refit:
+                raise ValueError("`n_jobs` is only supported with `refit!=False`.")
+            if refit_strategy == "warm_start":
+                raise ValueError(
+                    "`n_jobs` is not supported with `refit_strategy='warm_start'`."
+                )
+            if not all(isinstance(model, BaseAuto) for model in self.models):
+                raise ValueError(
+                    "`n_jobs` is only supported when every model is an auto model, "
+                    "the refits of the other models resume from the previous weights."
+                )
+            if n_jobs == 0 or n_jobs < -1:
+                raise ValueError(
+                    f"`n_jobs` must be a positive integer or -1, got: {n_jobs}"
+                )
+        if metrics is not None:
+            if refit:
+                raise ValueError("`metrics` is only supported with `refit=False`.")
+            if chunk_size < 1:
+                raise ValueError(
+                    f"`chunk_size` must be a positive integer, got: {chunk_size}"
+                )
+        elif spill_path is not None:
+            raise ValueError("`spill_path` is only supported when passing `metrics`.")
+
+        target_df = None
+        if _is_lazy_input(df):
+            df = self._scan_lazy(df, id_col, time_col, target_col)
+            if not isinstance(df, pl_DataFrame):
+                import pyarrow as pa
+
+                if refit:
+                    # the refit windows are taken from a frame, which only has the projected columns
+                    df = pa.Table.from_batches(list(df)).to_pandas(self_destruct=True)
+                else:
+                    # the dataset is built from the batches and only the target is kept as a frame
+                    target_batches: List = []
+                    self.dataset, self.uids, self.last_dates, self.ds = (
+                        self._prepare_fit(
+                            df=_tee_columns(
+                                df, [id_col, time_col, target_col], target_batches
+                            ),
+                            static_df=static_df,
+                            predict_only=False,
+                            id_col=id_col,
+                            time_col=time_col,
+                            target_col=target_col,
+                        )
+                    )
+                    target_df = pa.Table.from_batches(target_batches).to_pandas(
+                        self_destruct=True
+                    )
+                    df = None
+
+        if not refit and metrics is not None:
+            return self._streaming_cross_validation(
+                df=df,
+                target_df=target_df,
+                static_df=static_df,
+                n_windows=n_windows,
+                step_size=step_size,
+                val_size=val_size,
+                test_size=test_size,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                metrics=metrics,
+                spill_path=spill_path,
+                chunk_size=chunk_size,
+                **data_kwargs,
+            )
         if not refit:
 
             return self._no_refit_cross_validation(
                 df=df,
+                target_df=target_df,
                 static_df=static_df,
                 n_windows=n_windows,
                 step_size=step_size,
@@ -1199,54 +3205,72 @@ class NeuralForecast:
             )
         if df is None:
             raise ValueError("Must specify `df` with `refit!=False`.")
+        if not isinstance(df, (pd.DataFrame, pl_DataFrame)):
+            raise ValueError(
+                "`df` must be a pandas or polars DataFrame with `refit!=False`."
+            )
         validate_freq(df[time_col], self.freq)
-        splits = ufp.backtest_splits(
-            df,
-            n_windows=n_windows,
-            h=self.h,
+        # conformal prediction computes its scores with a cross validation over each train set
+        views = None
+        if prediction_intervals is None:
+            views = self._backtest_views(
+                df=df,
+                static_df=static_df,
+                n_windows=n_windows,
+                step_size=step_size,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+        if views is not None:
+            uids, ds, splits = views
+        else:
+            uids, ds = None, None
+            splits = ufp.backtest_splits(
+                df,
+                n_windows=n_windows,
+                h=self.h,
+                id_col=id_col,
+                time_col=time_col,
+                freq=self.freq,
+                step_size=step_size,
+                input_size=None,
+            )
+        window_kwargs = dict(
+            uids=uids,
+            ds=ds,
+            refit=refit,
+            static_df=static_df,
+            val_size=val_size,
+            verbose=verbose,
             id_col=id_col,
             time_col=time_col,
-            freq=self.freq,
-            step_size=step_size,
-            input_size=None,
+            target_col=target_col,
+            prediction_intervals=prediction_intervals,
+            level=level,
+            quantiles=quantiles,
+            data_kwargs=data_kwargs,
         )
-        results = []
-        for i_window, (cutoffs, train, test) in enumerate(splits):
-            should_fit = i_window == 0 or (refit > 0 and i_window % refit == 0)
-            if should_fit:
-                self.fit(
-                    df=train,
-                    static_df=static_df,
-                    val_size=val_size,
-                    use_init_models=False,
-                    verbose=verbose,
-                    id_col=id_col,
-                    time_col=time_col,
-                    target_col=target_col,
-                    prediction_intervals=prediction_intervals,
-                )
-                predict_df: Optional[DataFrame] = None
-            else:
-                predict_df = train
-            needed_futr_exog = self._get_needed_futr_exog()
-            if needed_futr_exog:
-                futr_df: Optional[DataFrame] = test
-            else:
-                futr_df = None
-            preds = self.predict(
-                df=predict_df,
-                static_df=static_df,
-                futr_df=futr_df,
-                verbose=verbose,
-                level=level,
-                quantiles=quantiles,
-                **data_kwargs,
+        if n_jobs is not None:
+            results = self._parallel_refit_windows(
+                list(splits), n_jobs=n_jobs, **window_kwargs
             )
-            preds = ufp.join(preds, cutoffs, on=id_col, how="left")
-            fold_result = ufp.join(
-                preds, test[[id_col, time_col, target_col]], on=[id_col, time_col]
-            )
-            results.append(fold_result)
+        else:
+            # the first fit uses the full budget, the following ones resume from its optimizer state
+            warm_start_models = []
+            if refit_strategy == "warm_start":
+                warm_start_models = [
+                    m for m in self.models if not isinstance(m, BaseAuto)
+                ]
+            for model in warm_start_models:
+                model.warm_start_steps = refit_steps
+            try:
+                results = self._refit_windows(splits, **window_kwargs)
+            finally:
+                # release the optimizer states, later fits use the full budget again
+                for model in warm_start_models:
+                    model.warm_start_steps = None
+                    model._optimizer_state = None
         out = ufp.vertical_concat(results, match_categories=False)
         out = ufp.drop_index_if_pandas(out)
         # match order of cv with no refit
@@ -1279,86 +3303,86 @@ class NeuralForecast:
             )
         test_size = self.models[0].get_test_size()
 
-        # Process each series separately
-        fcsts_dfs = []
-        trimmed_datasets = []
-
-        for i in range(self.dataset.n_groups):
-            # Calculate series-specific length and offset
-            series_length = self.dataset.indptr[i + 1] - self.dataset.indptr[i]
-            _, forefront_offset = np.divmod(
-                (series_length - test_size - self.h), step_size
-            )
-
-            if test_size > 0 or forefront_offset > 0:
-                # Create single-series dataset
-                series_dataset = TimeSeriesDataset(
-                    temporal=self.dataset.temporal[
-                        self.dataset.indptr[i] : self.dataset.indptr[i + 1]
-                    ],
-                    temporal_cols=self.dataset.temporal_cols,
-                    indptr=np.array([0, series_length]),
-                    y_idx=self.dataset.y_idx,
-                )
-
-                # Trim the series
-                trimmed_series = TimeSeriesDataset.trim_dataset(
-                    dataset=series_dataset,
-                    right_trim=test_size,
-                    left_trim=forefront_offset,
-                )
-
-                new_idxs = np.arange(
-                    self.dataset.indptr[i] + forefront_offset,
-                    self.dataset.indptr[i + 1] - test_size,
-                )
-                times = self.ds[new_idxs]
-            else:
-                trimmed_series = TimeSeriesDataset(
-                    temporal=self.dataset.temporal[
-                        self.dataset.indptr[i] : self.dataset.indptr[i + 1]
-                    ],
-                    temporal_cols=self.dataset.temporal_cols,
-                    indptr=np.array([0, series_length]),
-                    y_idx=self.dataset.y_idx,
-                )
-                times = self.ds[self.dataset.indptr[i] : self.dataset.indptr[i + 1]]
-
-            series_fcsts_df = _insample_times(
-                times=times,
-                uids=self.uids[i : i + 1],
-                indptr=trimmed_series.indptr,
-                h=self.h,
-                freq=self.freq,
-                step_size=step_size,
-                id_col=self.id_col,
-                time_col=self.time_col,
-            )
-
-            fcsts_dfs.append(series_fcsts_df)
-            trimmed_datasets.append(trimmed_series)
+        # Trim the test set and the first samples that don't fit the step size of each serie
+        sizes = np.diff(self.dataset.indptr)
+        forefront_offsets = np.remainder(sizes - test_size - self.h, step_size)
+        trimmed_sizes = sizes - test_size - forefront_offsets
+        trimmed_indptr = np.append(0, trimmed_sizes.cumsum()).astype(
+            self.dataset.indptr.dtype
+        )
+        trimmed_idxs = np.repeat(
+            self.dataset.indptr[:-1] + forefront_offsets - trimmed_indptr[:-1],
+            trimmed_sizes,
+        ) + np.arange(trimmed_indptr[-1])
+        trimmed_dataset = TimeSeriesDataset(
+            temporal=self.dataset.temporal[trimmed_idxs],
+            temporal_cols=self.dataset.temporal_cols,
+            indptr=trimmed_indptr,
+            y_idx=self.dataset.y_idx,
+            static=self.dataset.static,
+            static_cols=self.dataset.static_cols,
+        )
+        fcsts_df = _insample_times(
+            times=self.ds[trimmed_idxs],
+            uids=self.uids,
+            indptr=trimmed_indptr,
+            h=self.h,
+            freq=self.freq,
+            step_size=step_size,
+            id_col=self.id_col,
+            time_col=self.time_col,
+        )
 
-        # Combine all series forecasts DataFrames
-        fcsts_df = ufp.vertical_concat(fcsts_dfs)
+        # The series with a similar number of windows are predicted together, left padded to the
+        # longest one of their group, so at most half of the windows of a group are padding.
+        # Multivariate models need all the series at once, so they use a single group.
+        n_windows = (trimmed_sizes - self.h) // step_size + 1
+        out_indptr = np.append(0, (n_windows * self.h).cumsum())
+        buckets = np.log2(np.maximum(n_windows, 1)).astype(np.int64)
+        univariate_groups = [np.flatnonzero(buckets == b) for b in np.unique(buckets)]
+        all_series = [np.arange(self.dataset.n_groups)]
 
         # Generate predictions for each model
         fcsts_list = []
         for model in self.models:
-            model_series_preds = []
-            for i, trimmed_dataset in enumerate(trimmed_datasets):
-                # Set test size to current series length
-                model.set_test_size(test_size=trimmed_dataset.max_size)
-                # Generate predictions
-                model_fcsts = model.predict(trimmed_dataset, step_size=step_size)
-                # Handle distributional forecasts; take only median
-                if len(model_fcsts.shape) > 1 and model_fcsts.shape[1] == 3:
-                    model_fcsts = model_fcsts[:, 0]  # Take first column (median)
-                # Ensure consistent 2D shape
-                if len(model_fcsts.shape) == 1:
-                    model_fcsts = model_fcsts.reshape(-1, 1)
-                model_series_preds.append(model_fcsts)
-            model_preds = np.concatenate(model_series_preds, axis=0)
-            fcsts_list.append(model_preds)
+            groups = all_series if model.MULTIVARIATE else univariate_groups
+            parts = []
+            for idxs in groups:
+                if idxs.size == self.dataset.n_groups:
+                    group_dataset = trimmed_dataset
+                else:
+                    group_dataset = trimmed_dataset.take(idxs)
+                # Set test size to the longest serie of the group
+                model.set_test_size(test_size=group_dataset.max_size)
+                group_fcsts = model.predict(group_dataset, step_size=step_size)
+                # keep the last windows of each serie, which only see its own samples
+                group_windows = n_windows[idxs]
+                max_windows = group_windows.max()
+                group_sizes = group_windows * self.h
+                group_indptr = np.append(0, group_sizes.cumsum())
+                keep_idxs = np.repeat(
+                    np.arange(idxs.size) * max_windows * self.h
+                    + (max_windows - group_windows) * self.h
+                    - group_indptr[:-1],
+                    group_sizes,
+                ) + np.arange(group_indptr[-1])
+                out_idxs = np.repeat(
+                    out_indptr[idxs] - group_indptr[:-1], group_sizes
+                ) + np.arange(group_indptr[-1])
+                parts.append((out_idxs, group_fcsts[keep_idxs]))
+            first_fcsts = parts[0][1]
+            model_fcsts = np.empty(
+                (out_indptr[-1], *first_fcsts.shape[1:]), dtype=first_fcsts.dtype
+            )
+            for out_idxs, group_fcsts in parts:
+                model_fcsts[out_idxs] = group_fcsts
+            # Handle distributional forecasts; take only median
+            if len(model_fcsts.shape) > 1 and model_fcsts.shape[1] == 3:
+                model_fcsts = model_fcsts[:, 0]  # Take first column (median)
+            # Ensure consistent 2D shape
+            if len(model_fcsts.shape) == 1:
+                model_fcsts = model_fcsts.reshape(-1, 1)
+            fcsts_list.append(model_fcsts)
             # Reset test size to original
             model.set_test_size(test_size=test_size)
 
@@ -1368,7 +3392,7 @@ class NeuralForecast:
         # Add original y values
         original_y = {
             self.id_col: ufp.repeat(self.uids, np.diff(self.dataset.indptr)),
-            self.time_col: self.ds,
+            self.time_col: np.asarray(self.ds),
             self.target_col: self.dataset.temporal[:, 0].numpy(),
         }
 
@@ -1491,6 +3515,9 @@ class NeuralForecast:
             "freq": self.freq,
             "_fitted": self._fitted,
             "local_scaler_type": self.local_scaler_type,
+            "compact_times": self.compact_times,
+            "preprocessing_cache_size": self.preprocessing_cache_size,
+            "preprocessing_cache_dir": self.preprocessing_cache_dir,
             "scalers_": self.scalers_,
             "id_col": self.id_col,
             "time_col": self.time_col,
@@ -1499,6 +3526,10 @@ class NeuralForecast:
         for attr in ["prediction_intervals", "_cs_df"]:
             # conformal prediction related attributes was not available < 1.7.6
             config_dict[attr] = getattr(self, attr, None)
+        for attr in ["shards_", "shards_imbalance_"]:
+            # the assignment of the series to the processes of distributed training
+            if hasattr(self, attr):
+                config_dict[attr] = getattr(self, attr)
 
         if save_dataset:
             config_dict.update(
@@ -1597,6 +3628,9 @@ class NeuralForecast:
             models=models,
             freq=config_dict["freq"],
             local_scaler_type=config_dict.get("local_scaler_type", default_scalar_type),
+            compact_times=config_dict.get("compact_times", False),
+            preprocessing_cache_size=config_dict.get("preprocessing_cache_size", None),
+            preprocessing_cache_dir=config_dict.get("preprocessing_cache_dir", None),
         )
 
         attr_to_default = {"id_col": "unique_id", "time_col": "ds", "target_col": "y"}
@@ -1605,6 +3639,9 @@ class NeuralForecast:
         # only restore attribute if available
         for attr in ["prediction_intervals", "_cs_df"]:
             setattr(neuralforecast, attr, config_dict.get(attr, None))
+        for attr in ["shards_", "shards_imbalance_"]:
+            if attr in config_dict:
+                setattr(neuralforecast, attr, config_dict[attr])
 
         # Dataset
         if dataset is not None:
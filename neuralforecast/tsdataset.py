@@ -1,21 +1,24 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/tsdataset.ipynb.
 
 # %% auto 0
-__all__ = ['TimeSeriesLoader', 'BaseTimeSeriesDataset', 'TimeSeriesDataset', 'LocalFilesTimeSeriesDataset',
-           'TimeSeriesDataModule']
+__all__ = ['TimeSeriesLoader', 'BaseTimeSeriesDataset', 'TimeSeriesArrays', 'TimeSeriesDataset',
+           'LocalFilesTimeSeriesDataset', 'TimeSeriesDataModule']
 
 # %% ../nbs/tsdataset.ipynb 4
+import heapq
 from collections.abc import Mapping
 from pathlib import Path
-from typing import List, Optional, Sequence, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
 
+import fsspec
 import numpy as np
 import pandas as pd
 import pytorch_lightning as pl
 import torch
 import utilsforecast.processing as ufp
-from torch.utils.data import Dataset, DataLoader
-from utilsforecast.compat import DataFrame, pl_Series
+from coreforecast.grouped_array import GroupedArray
+from torch.utils.data import Dataset, DataLoader, Subset
+from utilsforecast.compat import DataFrame, pl_DataFrame, pl_Series
 
 # %% ../nbs/tsdataset.ipynb 5
 class TimeSeriesLoader(DataLoader):
@@ -113,19 +116,70 @@ class BaseTimeSeriesDataset(Dataset):
     ) -> torch.Tensor:
         if isinstance(x, np.ndarray):
             x = torch.from_numpy(x)
-        return x.to(dtype, copy=False).clone()
+        if x.dtype != dtype:
+            # the conversion already makes a copy
+            return x.to(dtype)
+        return x.clone()
+
+    def _as_torch(
+        self,
+        x: Union[np.ndarray, torch.Tensor],
+        dtype: torch.dtype = torch.float32,
+    ) -> torch.Tensor:
+        # shares the memory of x if it's already contiguous and of the right type
+        if isinstance(x, np.ndarray):
+            x = torch.from_numpy(x)
+        if x.dtype != dtype:
+            return x.to(dtype, memory_format=torch.contiguous_format)
+        return x.contiguous()
 
     @staticmethod
     def _ensure_available_mask(data: np.ndarray, temporal_cols):
         if "available_mask" not in temporal_cols:
-            available_mask = np.ones((len(data), 1), dtype=np.float32)
+            # write the features and the mask into a single float32 block
+            temporal = np.empty((data.shape[0], data.shape[1] + 1), dtype=np.float32)
+            temporal[:, :-1] = data
+            temporal[:, -1] = 1.0
             temporal_cols = temporal_cols.append(pd.Index(["available_mask"]))
-            data = np.append(data, available_mask, axis=1)
+            data = temporal
         return data, temporal_cols
 
+    @staticmethod
+    def _arrow_temporal_cols(names, id_col, time_col, target_col, exclude=()):
+        temporal_cols = [target_col] + [
+            c for c in names if c not in (id_col, time_col, target_col, *exclude)
+        ]
+        if "available_mask" not in temporal_cols:
+            temporal_cols.append("available_mask")
+        return temporal_cols
+
+    @staticmethod
+    def _arrow_temporal(
+        data, id_col, time_col, target_col, temporal_cols=None, out=None
+    ):
+        # writes the columns of a pyarrow Table or RecordBatch into a float32 block, or into `out`
+        if temporal_cols is None:
+            temporal_cols = BaseTimeSeriesDataset._arrow_temporal_cols(
+                data.schema.names, id_col, time_col, target_col
+            )
+        if out is None:
+            temporal = np.empty((data.num_rows, len(temporal_cols)), dtype=np.float32)
+        else:
+            temporal = out
+        for i, col in enumerate(temporal_cols):
+            if col in data.schema.names:
+                # nulls are read as NaN
+                temporal[:, i] = data.column(col).to_numpy(zero_copy_only=False)
+            else:
+                temporal[:, i] = 1.0
+        return temporal, temporal_cols
+
     @staticmethod
     def _extract_static_features(static_df, id_col):
         if static_df is not None:
+            if not isinstance(static_df, (pd.DataFrame, pl_DataFrame)):
+                # pyarrow tables
+                static_df = static_df.to_pandas()
             static_df = ufp.sort(static_df, by=id_col)
             static_cols = [col for col in static_df.columns if col != id_col]
             static = ufp.to_numpy(static_df[static_cols])
@@ -136,6 +190,23 @@ class BaseTimeSeriesDataset(Dataset):
         return static, static_cols
 
 # %% ../nbs/tsdataset.ipynb 8
+class TimeSeriesArrays(NamedTuple):
+    """Series sorted by id and time as numpy arrays.
+
+    `values` has one row per sample with the target in its first column and the
+    samples of the i-th serie are in the rows `indptr[i]` to `indptr[i + 1]`.
+    The names of the columns of `values` and `static` are required when they have
+    more than the target."""
+
+    ids: np.ndarray
+    indptr: np.ndarray
+    times: np.ndarray
+    values: np.ndarray
+    static: Optional[np.ndarray] = None
+    temporal_cols: Optional[Sequence[str]] = None
+    static_cols: Optional[Sequence[str]] = None
+
+
 class TimeSeriesDataset(BaseTimeSeriesDataset):
 
     def __init__(
@@ -146,8 +217,12 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         y_idx: int,
         static=None,
         static_cols=None,
+        copy: bool = True,
     ):
-        self.temporal = self._as_torch_copy(temporal)
+        if copy:
+            self.temporal = self._as_torch_copy(temporal)
+        else:
+            self.temporal = self._as_torch(temporal)
         self.indptr = indptr
         self.n_groups = self.indptr.size - 1
         sizes = np.diff(indptr)
@@ -219,6 +294,24 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         )
         return dataset
 
+    def align_slots(
+        self, df: DataFrame, slots: np.ndarray, h: int
+    ) -> "TimeSeriesDataset":
+        """
+        Same as `align` for the `h` future samples of each serie, when the rows of `df` are already
+        mapped to their slots `serie * h + step` of the future samples, -1 for rows that aren't used.
+        The values of each column are scattered into their slots, `df` isn't sorted nor processed.
+        """
+        futr_dataset = self.empty_future(h)
+        used = slots >= 0
+        used_slots = torch.from_numpy(slots[used])
+        for j, col in enumerate(self.temporal_cols):
+            if col == "available_mask" or col not in df.columns:
+                continue
+            values = np.asarray(df[col], dtype=np.float32)[used]
+            futr_dataset.temporal[used_slots, j] = torch.from_numpy(values)
+        return futr_dataset
+
     def append(self, futr_dataset: "TimeSeriesDataset") -> "TimeSeriesDataset":
         """Add future observations to the dataset. Returns a copy"""
         if self.indptr.size != futr_dataset.indptr.size:
@@ -252,6 +345,87 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             static_cols=self.static_cols,
         )
 
+    def truncate(self, sizes: np.ndarray) -> "_TimeSeriesDatasetView":
+        """
+        Truncate each serie to its first `sizes[i]` observations.
+        Returns a view that shares the temporal buffer of the dataset.
+        """
+        return _TimeSeriesDatasetView(self, np.asarray(sizes))
+
+    def take_range(self, start: int, stop: int) -> "TimeSeriesDataset":
+        """
+        Keep the series from `start` to `stop`.
+        Returns a dataset that shares the temporal buffer of the dataset.
+        """
+        indptr = self.indptr[start : stop + 1]
+        return TimeSeriesDataset(
+            temporal=self.temporal[indptr[0] : indptr[-1]],
+            temporal_cols=self.temporal_cols.copy(),
+            indptr=indptr - indptr[0],
+            y_idx=self.y_idx,
+            static=None if self.static is None else self.static[start:stop],
+            static_cols=self.static_cols,
+            copy=False,
+        )
+
+    def take(self, idxs: np.ndarray, n: Optional[int] = None) -> "TimeSeriesDataset":
+        """
+        Keep the series in `idxs`, with their last `n` samples if `n` is passed.
+        Only the rows of the kept samples are copied.
+        """
+        idxs = np.asarray(idxs)
+        ends = self.indptr[idxs + 1]
+        sizes = ends - self.indptr[idxs]
+        if n is not None:
+            sizes = np.minimum(sizes, n)
+        indptr = np.append(0, sizes.cumsum()).astype(self.indptr.dtype)
+        rows = np.repeat(ends - indptr[1:], sizes) + np.arange(indptr[-1])
+        return TimeSeriesDataset(
+            temporal=self.temporal[rows],
+            temporal_cols=self.temporal_cols.copy(),
+            indptr=indptr,
+            y_idx=self.y_idx,
+            static=None if self.static is None else self.static[idxs],
+            static_cols=self.static_cols,
+            copy=False,
+        )
+
+    def empty_future(self, h: int) -> "TimeSeriesDataset":
+        """
+        Dataset with `h` missing samples after each serie, the aligned future of series without future exogenous.
+        Doesn't build the frame of the future times.
+        """
+        temporal = torch.full(
+            (self.n_groups * h, len(self.temporal_cols)), float("nan")
+        )
+        if "available_mask" in self.temporal_cols:
+            temporal[:, self.temporal_cols.get_loc("available_mask")] = 1.0
+        return TimeSeriesDataset(
+            temporal=temporal,
+            temporal_cols=self.temporal_cols.copy(),
+            indptr=np.arange(0, self.n_groups * h + 1, h, dtype=self.indptr.dtype),
+            y_idx=self.y_idx,
+            copy=False,
+        )
+
+    @staticmethod
+    def concat(datasets: List["TimeSeriesDataset"]) -> "TimeSeriesDataset":
+        """
+        Stack the series of `datasets`, which must have the same columns.
+        Returns a copy
+        """
+        sizes = np.concatenate([np.diff(dataset.indptr) for dataset in datasets])
+        statics = [dataset.static for dataset in datasets]
+        return TimeSeriesDataset(
+            temporal=torch.cat([dataset.temporal for dataset in datasets]),
+            temporal_cols=datasets[0].temporal_cols.copy(),
+            indptr=np.append(0, sizes.cumsum()).astype(datasets[0].indptr.dtype),
+            y_idx=datasets[0].y_idx,
+            static=None if statics[0] is None else np.concatenate(statics),
+            static_cols=datasets[0].static_cols,
+            copy=False,
+        )
+
     @staticmethod
     def update_dataset(
         dataset, futr_df, id_col="unique_id", time_col="ds", target_col="y"
@@ -315,7 +489,6 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             [target_col]
             + [c for c in df.columns if c not in (id_col, time_col, target_col)]
         )
-        temporal = data.astype(np.float32, copy=False)
         indices = ids
         if isinstance(df, pd.DataFrame):
             dates = pd.Index(times, name=time_col)
@@ -334,13 +507,390 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             static_cols=static_cols,
             indptr=indptr,
             y_idx=0,
+            # the block with the available mask is already a new array
+            copy=temporal is data,
         )
         ds = df[time_col].to_numpy()
         if sort_idxs is not None:
             ds = ds[sort_idxs]
         return dataset, indices, dates, ds
 
+    @staticmethod
+    def from_arrays(
+        arrays: TimeSeriesArrays,
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+        copy: bool = False,
+    ):
+        """Build the dataset from series that are already sorted by id and time.
+
+        The temporal data shares the memory of `arrays.values` if it's a contiguous float32
+        array that includes the available mask and `copy=False`, otherwise it's copied once."""
+        ids, indptr, times, values, static, temporal_cols, static_cols = arrays
+        indptr = np.asarray(indptr)
+        if values.ndim == 1:
+            values = values[:, None]
+        if temporal_cols is None:
+            if values.shape[1] > 1:
+                raise ValueError(
+                    "`temporal_cols` must be provided when `values` has more than one column."
+                )
+            temporal_cols = [target_col]
+        temporal_index = pd.Index(list(temporal_cols))
+        if temporal_index.size != values.shape[1]:
+            raise ValueError(
+                f"Got {temporal_index.size} temporal columns for {values.shape[1]} columns in `values`."
+            )
+        if temporal_index[0] != target_col:
+            raise ValueError(
+                f"The first column of `values` must be the target ({target_col})."
+            )
+        if (
+            indptr.ndim != 1
+            or indptr[0] != 0
+            or indptr[-1] != values.shape[0]
+            or (np.diff(indptr) < 1).any()
+        ):
+            raise ValueError(
+                "`indptr` must be increasing, start at 0 and end at the number of rows of `values`."
+            )
+        if len(ids) != indptr.size - 1 or len(times) != values.shape[0]:
+            raise ValueError(
+                "`ids` must have one entry per serie and `times` one entry per row of `values`."
+            )
+        if static is not None:
+            if static.ndim == 1:
+                static = static[:, None]
+            if static_cols is None or len(static_cols) != static.shape[1]:
+                raise ValueError("`static_cols` must name each column of `static`.")
+            static_cols = pd.Index(list(static_cols))
+
+        # the mask is appended while converting to float32 if it's missing
+        temporal, temporal_index = TimeSeriesDataset._ensure_available_mask(
+            values, temporal_index
+        )
+        dataset = TimeSeriesDataset(
+            temporal=temporal,
+            temporal_cols=temporal_index,
+            static=static,
+            static_cols=static_cols,
+            indptr=indptr.astype(np.int32, copy=False),
+            y_idx=0,
+            copy=copy and temporal is values,
+        )
+        times = np.asarray(times)
+        indices = pd.Series(ids, name=id_col)
+        dates = pd.Index(times[indptr[1:] - 1], name=time_col)
+        return dataset, indices, dates, times
+
+    @staticmethod
+    def from_arrow(
+        table,
+        static_df=None,
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+    ):
+        """Build the dataset from a pyarrow Table that is already sorted by id and time.
+
+        Each column is written straight into the float32 block of the dataset."""
+        temporal, temporal_cols = TimeSeriesDataset._arrow_temporal(
+            table, id_col, time_col, target_col
+        )
+        ids = table[id_col].to_numpy()
+        starts = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+        indptr = np.append(0, np.append(starts, table.num_rows)).astype(np.int32)
+
+        static, static_cols = TimeSeriesDataset._extract_static_features(
+            static_df, id_col
+        )
+        arrays = TimeSeriesArrays(
+            ids=ids[indptr[:-1]],
+            indptr=indptr,
+            times=table[time_col].to_numpy(),
+            values=temporal,
+            static=static,
+            temporal_cols=temporal_cols,
+            static_cols=static_cols,
+        )
+        # the block is already a new array
+        return TimeSeriesDataset.from_arrays(
+            arrays, id_col=id_col, time_col=time_col, target_col=target_col, copy=False
+        )
+
+    @staticmethod
+    def from_batches(
+        batches,
+        static_df=None,
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+        static_cols: Optional[List[str]] = None,
+        num_rows: Optional[int] = None,
+    ):
+        """Build the dataset from an iterable of pyarrow RecordBatches in any order.
+
+        Each batch is written into a float32 block as it's read, so the input is never
+        held as a DataFrame. The rows are sorted by id and time only if they aren't already.
+        `static_cols` are columns of the batches that are constant within each serie, extracted
+        in the same pass instead of from `static_df`. If the total `num_rows` is known, the batches
+        are written into a single preallocated block."""
+        ids, times_list, blocks = [], [], []
+        static_ids, static_rows_list = [], []
+        temporal_cols = None
+        # preallocated from the first batch when the number of rows is known
+        temporal = np.empty((0, 0), dtype=np.float32)
+        offset = 0
+        for batch in batches:
+            if temporal_cols is None:
+                temporal_cols = TimeSeriesDataset._arrow_temporal_cols(
+                    batch.schema.names, id_col, time_col, target_col, static_cols or ()
+                )
+                if num_rows is not None:
+                    temporal = np.empty(
+                        (num_rows, len(temporal_cols)), dtype=np.float32
+                    )
+            if num_rows is None:
+                block, _ = TimeSeriesDataset._arrow_temporal(
+                    batch, id_col, time_col, target_col, temporal_cols
+                )
+                blocks.append(block)
+            elif offset + batch.num_rows > num_rows:
+                raise ValueError(f"The batches have more than {num_rows:,} rows.")
+            else:
+                TimeSeriesDataset._arrow_temporal(
+                    batch,
+                    id_col,
+                    time_col,
+                    target_col,
+                    temporal_cols,
+                    out=temporal[offset : offset + batch.num_rows],
+                )
+            offset += batch.num_rows
+            ids.append(batch.column(id_col).to_numpy(zero_copy_only=False))
+            times_list.append(batch.column(time_col).to_numpy(zero_copy_only=False))
+            if static_cols and batch.num_rows:
+                # only the rows where the serie changes
+                batch_ids = ids[-1]
+                starts = np.append(True, batch_ids[1:] != batch_ids[:-1])
+                static_ids.append(batch_ids[starts])
+                static_rows_list.append(
+                    np.column_stack(
+                        [
+                            batch.column(col).to_numpy(zero_copy_only=False)[starts]
+                            for col in static_cols
+                        ]
+                    )
+                )
+        if not offset:
+            raise ValueError("The batches don't contain any rows.")
+        if num_rows is None:
+            temporal = blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+        elif offset < num_rows:
+            raise ValueError(
+                f"The batches have {offset:,} rows, expected {num_rows:,}."
+            )
+        del blocks
+        codes, uids = pd.factorize(np.concatenate(ids), sort=True)
+        times = np.concatenate(times_list)
+        step = np.diff(codes)
+        if not ((step > 0) | ((step == 0) & (times[1:] > times[:-1]))).all():
+            order = np.lexsort((times, codes))
+            codes, times, temporal = codes[order], times[order], temporal[order]
+        sizes = np.bincount(codes, minlength=uids.size)
+        indptr = np.append(0, sizes.cumsum()).astype(np.int32)
+
+        if static_cols:
+            static_rows = np.concatenate(static_rows_list)
+            static_codes = pd.Index(uids).get_indexer(np.concatenate(static_ids))
+            static = np.empty((uids.size, len(static_cols)), dtype=static_rows.dtype)
+            # reversed so that the first row of each serie is kept
+            static[static_codes[::-1]] = static_rows[::-1]
+            static_cols = pd.Index(static_cols)
+        else:
+            static, static_cols = TimeSeriesDataset._extract_static_features(
+                static_df, id_col
+            )
+        arrays = TimeSeriesArrays(
+            ids=uids,
+            indptr=indptr,
+            times=times,
+            values=temporal,
+            static=static,
+            temporal_cols=temporal_cols,
+            static_cols=static_cols,
+        )
+        return TimeSeriesDataset.from_arrays(
+            arrays, id_col=id_col, time_col=time_col, target_col=target_col, copy=False
+        )
+
 # %% ../nbs/tsdataset.ipynb 9
+class _TimeSeriesDatasetView(BaseTimeSeriesDataset):
+    """Time truncated view of a `TimeSeriesDataset`.
+
+    Keeps the first `sizes[i]` observations of each serie by indexing
+    into the temporal buffer of `dataset`, which is not copied."""
+
+    def __init__(self, dataset: TimeSeriesDataset, sizes: np.ndarray):
+        full_sizes = np.diff(dataset.indptr)
+        if (sizes < 1).any() or (sizes > full_sizes).any():
+            raise ValueError("`sizes` must be between 1 and the size of each serie.")
+        super().__init__(
+            temporal_cols=dataset.temporal_cols,
+            max_size=sizes.max().item(),
+            min_size=sizes.min().item(),
+            y_idx=dataset.y_idx,
+            static_cols=dataset.static_cols,
+        )
+        # share the static features instead of copying them
+        self.static = dataset.static
+        self.temporal = dataset.temporal
+        self.starts = dataset.indptr[:-1]
+        self.sizes = sizes
+        # indptr of the series once materialized
+        self.indptr = np.append(0, sizes.cumsum()).astype(dataset.indptr.dtype)
+        self.n_groups = dataset.n_groups
+
+    def __getitem__(self, idx):
+        if isinstance(idx, int):
+            temporal = torch.zeros(
+                size=(len(self.temporal_cols), self.max_size), dtype=torch.float32
+            )
+            start = self.starts[idx]
+            ts = self.temporal[start : start + self.sizes[idx], :]
+            temporal[: len(self.temporal_cols), -len(ts) :] = ts.permute(1, 0)
+            static = None if self.static is None else self.static[idx, :]
+            item = dict(
+                temporal=temporal,
+                temporal_cols=self.temporal_cols,
+                static=static,
+                static_cols=self.static_cols,
+                y_idx=self.y_idx,
+            )
+            return item
+        raise ValueError(f"idx must be int, got {type(idx)}")
+
+    def __repr__(self):
+        return f"_TimeSeriesDatasetView(n_data={self.indptr[-1]:,}, n_groups={self.n_groups:,})"
+
+    def take_idxs(self) -> np.ndarray:
+        """Positions of the rows of the view in the temporal buffer."""
+        return np.repeat(self.starts - self.indptr[:-1], self.sizes) + np.arange(
+            self.indptr[-1]
+        )
+
+    def materialize(self) -> TimeSeriesDataset:
+        """Copy the rows of the view into a new `TimeSeriesDataset`."""
+        return TimeSeriesDataset(
+            temporal=self.temporal[self.take_idxs()],
+            temporal_cols=self.temporal_cols.copy(),
+            indptr=self.indptr,
+            y_idx=self.y_idx,
+            static=self.static,
+            static_cols=self.static_cols,
+        )
+
+    align = TimeSeriesDataset.align
+    align_slots = TimeSeriesDataset.align_slots
+    empty_future = TimeSeriesDataset.empty_future
+
+    def append(self, futr_dataset: TimeSeriesDataset) -> TimeSeriesDataset:
+        """Add future observations to the dataset. Returns a copy"""
+        return self.materialize().append(futr_dataset)
+
+# %% ../nbs/tsdataset.ipynb 10
+class _CompactTimes:
+    """Compact representation of the timestamps of sorted series.
+
+    Stores the sorted unique timestamps and the position of the first
+    timestamp of each serie in them, so the time of any row is recovered
+    from its serie's start and its offset inside the serie."""
+
+    def __init__(self, grid: np.ndarray, starts: np.ndarray, indptr: np.ndarray):
+        self.grid = grid
+        self.starts = starts
+        self.indptr = indptr
+
+    @classmethod
+    def from_times(
+        cls, times: np.ndarray, indptr: np.ndarray
+    ) -> Optional["_CompactTimes"]:
+        """Build the compact times, returns `None` if the series aren't contiguous in the grid."""
+        times = np.asarray(times)
+        if times.size == 0:
+            return None
+        grid = np.unique(times)
+        starts = np.searchsorted(grid, times[indptr[:-1]])
+        compact = cls(grid=grid, starts=starts, indptr=indptr)
+        offsets = np.arange(times.size) - np.repeat(indptr[:-1], np.diff(indptr))
+        positions = np.repeat(starts, np.diff(indptr)) + offsets
+        if positions.max() >= grid.size or not np.array_equal(grid[positions], times):
+            return None
+        return compact
+
+    def take_series_rows(
+        self, offsets: np.ndarray, sizes: np.ndarray
+    ) -> "_CompactTimes":
+        """Times of `sizes` contiguous rows of each serie, starting `offsets` rows after its first one.
+        Shares the grid, so the times aren't materialized."""
+        indptr = np.append(0, np.cumsum(sizes)).astype(self.indptr.dtype)
+        return _CompactTimes(
+            grid=self.grid, starts=self.starts + offsets, indptr=indptr
+        )
+
+    def __len__(self) -> int:
+        return int(self.indptr[-1])
+
+    def __getitem__(self, idxs):
+        if isinstance(idxs, slice):
+            idxs = np.arange(*idxs.indices(len(self)))
+        idxs = np.asarray(idxs)
+        if idxs.dtype == bool:
+            idxs = np.flatnonzero(idxs)
+        idxs = np.where(idxs < 0, idxs + len(self), idxs)
+        series = np.searchsorted(self.indptr, idxs, side="right") - 1
+        return self.grid[self.starts[series] + idxs - self.indptr[series]]
+
+    def __array__(self, dtype=None, copy=None):
+        out = self[:]
+        return out if dtype is None else out.astype(dtype)
+
+    def __repr__(self):
+        return f"_CompactTimes(n_data={len(self):,}, n_times={self.grid.size:,})"
+
+# %% ../nbs/tsdataset.ipynb 11
+def _take_scalers(scalers, idxs):
+    # fitted local scalers that only keep the statistics of the series in `idxs`
+    return {col: scaler.take(idxs) for col, scaler in scalers.items()}
+
+
+def _balance_shards(sizes: np.ndarray, n_shards: int) -> np.ndarray:
+    # greedy longest first: each serie goes to the shard with the fewest samples so far
+    shards = np.empty(sizes.size, dtype=np.int32)
+    loads = [(0, shard) for shard in range(n_shards)]
+    for i in np.argsort(-sizes, kind="stable").tolist():
+        load, shard = heapq.heappop(loads)
+        shards[i] = shard
+        heapq.heappush(loads, (load + int(sizes[i]), shard))
+    return shards
+
+
+def _shards_imbalance(sizes: np.ndarray, shards: np.ndarray, n_shards: int) -> float:
+    # samples of the largest shard over the mean, the slowest process gates every step
+    totals = np.bincount(shards, weights=sizes, minlength=n_shards)
+    return float(totals.max() / totals.mean())
+
+
+def _series_sizes(dataset) -> np.ndarray:
+    # local files have the sizes read from their metadata or packed index
+    if hasattr(dataset, "indptr"):
+        return np.diff(dataset.indptr)
+    if getattr(dataset, "sizes", None) is not None:
+        return dataset.sizes
+    return np.ones(len(dataset), dtype=np.int64)
+
+
 class _FilesDataset:
     def __init__(
         self,
@@ -351,6 +901,8 @@ class _FilesDataset:
         target_col: str,
         min_size: int,
         static_cols: Optional[List[str]] = None,
+        scalers: Optional[List[dict]] = None,
+        scalers_uids: Optional[List[np.ndarray]] = None,
     ):
         self.files = files
         self.temporal_cols = pd.Index(temporal_cols)
@@ -359,9 +911,33 @@ class _FilesDataset:
         self.time_col = time_col
         self.target_col = target_col
         self.min_size = min_size
+        # local scalers fitted on each file and the ids of their series
+        self.scalers = scalers
+        self.scalers_uids = scalers_uids
+
+    def read(self, idx: int, with_static: bool = True):
+        import pyarrow.dataset as pds
+
+        # streams the row groups of the file, only with the needed columns, into a single block
+        fs, path = fsspec.core.url_to_fs(self.files[idx])
+        data = pds.dataset(path, filesystem=fs, format="parquet")
+        static_cols = []
+        if with_static and self.static_cols is not None:
+            static_cols = self.static_cols.tolist()
+        columns = [self.id_col, self.time_col, *self.temporal_cols, *static_cols]
+        return TimeSeriesDataset.from_batches(
+            data.to_batches(columns=columns),
+            id_col=self.id_col,
+            time_col=self.time_col,
+            target_col=self.target_col,
+            static_cols=static_cols or None,
+            num_rows=data.count_rows(),
+        )
 
-# %% ../nbs/tsdataset.ipynb 10
+# %% ../nbs/tsdataset.ipynb 12
 class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
+    # sidecar of the packed layout, ignored by pyarrow when reading the directory as a dataset
+    INDEX_FILE = "_series_index.parquet"
 
     def __init__(
         self,
@@ -377,6 +953,8 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         y_idx: int,
         static=None,
         static_cols=None,
+        locations=None,
+        sizes=None,
     ):
         super().__init__(
             temporal_cols=temporal_cols,
@@ -393,19 +971,101 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         # array with the last time for each timeseries
         self.last_times = last_times
         self.indices = indices
-        self.n_groups = len(files_ds)
+        # packed layout: index of the file and row group of each serie
+        self.locations = locations
+        # number of samples of each serie
+        self.sizes = sizes
+        self.n_groups = len(files_ds) if locations is None else len(locations)
+        self._packed_files: Dict[int, Any] = {}
+        # fitted local scalers, applied to each serie as it's read
+        self.scalers = None
+
+    def __getstate__(self):
+        # the open files aren't pickled, they're reopened by each process
+        state = self.__dict__.copy()
+        state["_packed_files"] = {}
+        return state
+
+    def _packed_file(self, i):
+        import pyarrow.parquet as pq
+
+        # the footer of each file is read once
+        if i not in self._packed_files:
+            self._packed_files[i] = pq.ParquetFile(self.files_ds[i])
+        return self._packed_files[i]
+
+    def _read_serie(self, idx, scale: bool = True):
+        temporal_cols = self.temporal_cols.copy()
+        if self.locations is None:
+            data = pd.read_parquet(
+                self.files_ds[idx], columns=temporal_cols.tolist()
+            ).to_numpy()
+        else:
+            # a single read of the row group of the serie
+            file_idx, row_group = self.locations[idx]
+            table = self._packed_file(file_idx).read_row_group(
+                row_group, columns=temporal_cols.tolist()
+            )
+            data, _ = self._arrow_temporal(
+                table,
+                self.id_col,
+                self.time_col,
+                self.target_col,
+                temporal_cols.tolist(),
+            )
+        data, temporal_cols = TimeSeriesDataset._ensure_available_mask(
+            data, temporal_cols
+        )
+        if scale and self.scalers:
+            indptr = np.array([0, data.shape[0]], dtype=np.int32)
+            self._scale(data, temporal_cols, indptr, _take_scalers(self.scalers, [idx]))
+        return data, temporal_cols
+
+    @staticmethod
+    def _scale(data, temporal_cols, indptr, scalers):
+        # transforms the columns of the series in place with their local scalers
+        for col, scaler in scalers.items():
+            i = temporal_cols.get_loc(col)
+            ga = GroupedArray(np.ascontiguousarray(data[:, i]), indptr)
+            data[:, i] = scaler.transform(ga)
+
+    def _read_tail(self, idx, n: Optional[int] = None):
+        # unscaled, the tail is copied since a view would keep the whole serie in memory
+        data, temporal_cols = self._read_serie(idx, scale=False)
+        if n is not None:
+            data = data[-n:].copy()
+        return data, temporal_cols
+
+    def read_tails(self, idxs, n: Optional[int] = None) -> TimeSeriesDataset:
+        """Read the last `n` samples of the series in `idxs` into a `TimeSeriesDataset`, or all of them if `n` is None.
+        The series are read one at a time, so only the tails are kept in memory."""
+        tails = []
+        for idx in idxs:
+            data, temporal_cols = self._read_tail(idx, n)
+            tails.append(data)
+        indptr = np.append(0, np.cumsum([len(tail) for tail in tails])).astype(np.int32)
+        temporal = np.concatenate(tails)
+        if self.scalers:
+            # the statistics of the series are taken once for the whole shard
+            self._scale(
+                temporal, temporal_cols, indptr, _take_scalers(self.scalers, idxs)
+            )
+        static = None if self.static is None else self.static[idxs]
+        return TimeSeriesDataset(
+            temporal=temporal,
+            temporal_cols=temporal_cols,
+            indptr=indptr,
+            y_idx=self.y_idx,
+            static=static,
+            static_cols=self.static_cols,
+            copy=False,
+        )
 
     def __getitem__(self, idx):
         if not isinstance(idx, int):
             raise ValueError(f"idx must be int, got {type(idx)}")
 
-        temporal_cols = self.temporal_cols.copy()
-        data = pd.read_parquet(
-            self.files_ds[idx], columns=temporal_cols.tolist()
-        ).to_numpy()
-        data, temporal_cols = TimeSeriesDataset._ensure_available_mask(
-            data, temporal_cols
-        )
+        data, temporal_cols = self._read_serie(idx)
         data = self._as_torch_copy(data)
 
         # Pad the temporal data to the left
@@ -450,6 +1110,7 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         min_size = float("inf")
         last_times = []
         ids = []
+        sizes = []
         expected_temporal = {target_col, *exogs}
         available_mask_seen = True
 
@@ -502,6 +1163,7 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
             min_size = min(total_rows, min_size)
             ids.append(uid)
             last_times.append(last_time)
+            sizes.append(total_rows)
 
         last_times = pd.Index(last_times, name=time_col)
         ids = pd.Series(ids, name=id_col)
@@ -523,10 +1185,105 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
             y_idx=0,
             static=static,
             static_cols=static_cols,
+            sizes=np.array(sizes, dtype=np.int64),
+        )
+        return dataset
+
+    @staticmethod
+    def pack(directories, path, time_col="ds", series_per_file=10_000):
+        """Write the series of the directory layout expected by `from_data_directories` into a packed layout in `path`.
+        Each parquet file holds up to `series_per_file` series with one row group per serie, and the `_series_index.parquet`
+        sidecar has the file, row group, size and last time of each serie, so reading a serie is a single seek.
+        Returns `path`, which can be loaded with `from_packed`."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        Path(path).mkdir(parents=True, exist_ok=True)
+        index = {"id": [], "file": [], "row_group": [], "size": [], "last_time": []}
+        writer = None
+        for i, dir in enumerate(directories):
+            dir_path = Path(dir)
+            if not dir_path.is_dir():
+                raise ValueError(f"paths must be directories, {dir} is not.")
+            table = pa.concat_tables(
+                [pq.read_table(file) for file in sorted(dir_path.glob("*.parquet"))]
+            )
+            table = table.sort_by(time_col)
+            if i % series_per_file == 0:
+                if writer is not None:
+                    writer.close()
+                file = f"part-{i // series_per_file:05d}.parquet"
+                writer = pq.ParquetWriter(Path(path) / file, table.schema)
+            table = table.select(writer.schema.names).cast(writer.schema)
+            writer.write_table(table, row_group_size=max(table.num_rows, 1))
+            index["id"].append(dir_path.name.split("=")[-1])
+            index["file"].append(file)
+            index["row_group"].append(i % series_per_file)
+            index["size"].append(table.num_rows)
+            # kept as a pyarrow scalar to preserve the type of the times
+            index["last_time"].append(table[time_col][-1])
+        if writer is not None:
+            writer.close()
+        index["last_time"] = pa.array(index["last_time"])
+        pq.write_table(
+            pa.table(index), Path(path) / LocalFilesTimeSeriesDataset.INDEX_FILE
+        )
+        return path
+
+    @staticmethod
+    def from_packed(
+        path,
+        static_df=None,
+        exogs=[],
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+    ):
+        """Load the packed layout written by `pack`. Only its index and the schema of its first file are read,
+        the series are read from their row groups when they're accessed."""
+        import pyarrow.parquet as pq
+
+        index = pq.read_table(
+            Path(path) / LocalFilesTimeSeriesDataset.INDEX_FILE
+        ).to_pandas()
+        # match the order of the static features
+        index = index.sort_values("id", ignore_index=True)
+        static, static_cols = TimeSeriesDataset._extract_static_features(
+            static_df, id_col
+        )
+
+        files = pd.Index(index["file"].unique())
+        schema = pq.read_schema(Path(path) / files[0])
+        missing_cols = {target_col, *exogs} - set(schema.names)
+        if missing_cols:
+            raise ValueError(
+                f"Temporal columns: {missing_cols} not found in the file: {files[0]}."
+            )
+        if "available_mask" in schema.names:
+            exogs = ["available_mask", *exogs]
+        locations = np.column_stack(
+            [files.get_indexer(index["file"]), index["row_group"]]
+        )
+
+        dataset = LocalFilesTimeSeriesDataset(
+            files_ds=[str(Path(path) / file) for file in files],
+            temporal_cols=pd.Index([target_col, *exogs]),
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            last_times=pd.Index(index["last_time"], name=time_col),
+            indices=pd.Series(index["id"], name=id_col),
+            min_size=int(index["size"].min()),
+            max_size=int(index["size"].max()),
+            y_idx=0,
+            static=static,
+            static_cols=static_cols,
+            locations=locations,
+            sizes=index["size"].to_numpy(dtype=np.int64),
         )
         return dataset
 
-# %% ../nbs/tsdataset.ipynb 13
+# %% ../nbs/tsdataset.ipynb 15
 class TimeSeriesDataModule(pl.LightningDataModule):
 
     def __init__(
@@ -575,7 +1332,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         )
         return loader
 
-# %% ../nbs/tsdataset.ipynb 27
+# %% ../nbs/tsdataset.ipynb 31
 class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
     def __init__(
         self,
@@ -597,20 +1354,30 @@ class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
     def setup(self, stage):
         import torch.distributed as dist
 
-        df = pd.read_parquet(self.files_ds.files[dist.get_rank()])
-        if self.files_ds.static_cols is not None:
-            static_df = (
-                df[[self.files_ds.id_col] + self.files_ds.static_cols.tolist()]
-                .groupby(self.files_ds.id_col, observed=True)
-                .head(1)
+        self.dataset, *_ = self.files_ds.read(dist.get_rank())
+        if self.files_ds.scalers is not None:
+            # the statistics of the series of this partition were fitted before training
+            scalers = self.files_ds.scalers[dist.get_rank()]
+            for col, scaler in scalers.items():
+                i = self.dataset.temporal_cols.get_loc(col)
+                ga = GroupedArray(
+                    self.dataset.temporal[:, i].numpy(), self.dataset.indptr
+                )
+                self.dataset.temporal[:, i] = torch.from_numpy(scaler.transform(ga))
+
+
+class _ShardedTimeSeriesDataModule(TimeSeriesDataModule):
+    # each process of a local data parallel training loads a shard of the series
+    def __init__(self, dataset: BaseTimeSeriesDataset, *args, **kwargs):
+        super().__init__(dataset, *args, **kwargs)
+        self.full_dataset = dataset
+        # shard of each serie, balanced by their sizes if not set
+        self.shards = None
+
+    def setup(self, stage):
+        if self.shards is None:
+            self.shards = _balance_shards(
+                _series_sizes(self.full_dataset), self.trainer.world_size
             )
-            df = df.drop(columns=self.files_ds.static_cols)
-        else:
-            static_df = None
-        self.dataset, *_ = TimeSeriesDataset.from_df(
-            df=df,
-            static_df=static_df,
-            id_col=self.files_ds.id_col,
-            time_col=self.files_ds.time_col,
-            target_col=self.files_ds.target_col,
-        )
+        idxs = np.flatnonzero(self.shards == self.trainer.global_rank)
+        self.dataset = Subset(self.full_dataset, idxs.tolist())